@@ -8,103 +8,206 @@ This script checks for dependencies and provides helpful error messages.
 
 import sys
 import os
+import functools
+import importlib.util
 
-def check_python_version():
-    """Check if Python version is sufficient"""
+# Files the game needs next to the launcher
+_REQUIRED_FILES = (
+    'halloween_haunt.py',
+    'entities.py',
+    'levels.py',
+    'ui.py',
+    'sound.py',
+    'game_manager.py',
+    'special_features.py'
+)
+
+# Optional asset folders for custom sprites, sounds and fonts
+_ASSET_DIRS = (
+    'assets',
+    'assets/sprites',
+    'assets/tiles',
+    'assets/music',
+    'assets/sfx',
+    'assets/ui',
+    'assets/fonts'
+)
+
+# Fixed launcher output, formatted once at import
+_LAUNCHER_BANNER = (
+    "🎃 Halloween Haunt: Candy Quest - Demo Launcher 🎃",
+    "                    BETA VERSION",
+    "="*50,
+    "\n🔍 Checking system requirements...",
+)
+_PY_BANNER = f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected"
+_FOUND_MESSAGES = tuple(f"✅ {file} found" for file in _REQUIRED_FILES)
+_GAME_FILES_HEADER = "\n📋 Checking game files..."
+_ASSET_HINT = "   Add custom sprites, sounds, and fonts to enhance the game!"
+_GAME_INSTRUCTIONS = (
+    "\n🎮 Starting Halloween Haunt: Candy Quest...",
+    "   Press F11 for fullscreen, ESC for pause menu",
+    "   Use WASD/arrows to move, SPACE to interact",
+    "   Collect 15 candies and return home to win each level!",
+    "\n" + "="*50,
+)
+
+@functools.lru_cache(maxsize=1)
+def _probe_python_version():
+    """Return (ok, messages) for the Python version check"""
     if sys.version_info < (3, 7):
-        print("❌ Error: Python 3.7 or higher is required.")
-        print(f"   Current version: {sys.version}")
-        print("   Please upgrade Python: https://python.org/downloads/")
-        return False
-    print(f"✅ Python {sys.version_info.major}.{sys.version_info.minor} detected")
-    return True
+        return False, (
+            "❌ Error: Python 3.7 or higher is required.",
+            f"   Current version: {sys.version}",
+            "   Please upgrade Python: https://python.org/downloads/",
+        )
+    return True, (_PY_BANNER,)
 
-def check_pygame():
-    """Check if Pygame is installed and working"""
+@functools.lru_cache(maxsize=1)
+def _probe_pygame():
+    """Return (ok, messages) for the Pygame check"""
+    # Only locate the package here; importing it loads SDL, which run_game does on demand
+    if importlib.util.find_spec('pygame') is None:
+        return False, (
+            "❌ Error: Pygame is not installed",
+            "   Install with: pip install pygame",
+            "   Or: python -m pip install pygame",
+        )
+    
+    # Read the version from package metadata rather than importing pygame for it
     try:
-        import pygame
-        pygame.init()
-        print(f"✅ Pygame {pygame.version.ver} is ready")
-        return True
+        from importlib.metadata import version, PackageNotFoundError
     except ImportError:
-        print("❌ Error: Pygame is not installed")
-        print("   Install with: pip install pygame")
-        print("   Or: python -m pip install pygame")
-        return False
-    except Exception as e:
-        print(f"❌ Error initializing Pygame: {e}")
-        return False
+        return True, ("✅ Pygame is installed",)  # Python 3.7 has no importlib.metadata
+    try:
+        return True, (f"✅ Pygame {version('pygame')} is installed",)
+    except PackageNotFoundError:
+        return True, ("✅ Pygame is installed",)  # e.g. distributed as pygame-ce
 
-def check_game_files():
-    """Check if all required game files exist"""
-    required_files = [
-        'halloween_haunt.py',
-        'entities.py', 
-        'levels.py',
-        'ui.py',
-        'sound.py',
-        'game_manager.py',
-        'special_features.py'
-    ]
+def _inventory():
+    """Scan the game folder (and assets/, if present) once for all setup checks.
     
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
-        else:
-            print(f"✅ {file} found")
+    Returns (present_files, existing_asset_dirs); present_files is None when
+    the game folder cannot be listed.
+    """
+    try:
+        with os.scandir('.') as entries:
+            cwd = {entry.name: entry for entry in entries}
+    except OSError:
+        return None, frozenset()
     
-    if missing_files:
-        print(f"❌ Error: Missing required files:")
-        for file in missing_files:
-            print(f"   - {file}")
-        return False
+    asset_dirs = set()
+    assets = cwd.get('assets')
+    if assets is not None and assets.is_dir():
+        asset_dirs.add('assets')
+        try:
+            with os.scandir('assets') as entries:
+                asset_dirs.update(f"assets/{entry.name}" for entry in entries if entry.is_dir())
+        except OSError:
+            pass
     
-    return True
+    # is_file() uses the file type from the directory listing, so a folder named
+    # like a module doesn't count and no extra stat() is needed (except for symlinks)
+    present_files = frozenset(name for name, entry in cwd.items() if entry.is_file())
+    return present_files, frozenset(asset_dirs)
 
-def create_assets_folder():
-    """Create assets folder structure if it doesn't exist"""
-    asset_dirs = [
-        'assets',
-        'assets/sprites',
-        'assets/tiles', 
-        'assets/music',
-        'assets/sfx',
-        'assets/ui',
-        'assets/fonts'
-    ]
+@functools.lru_cache(maxsize=1)
+def _probe_game_files(present):
+    """Return (ok, messages) for the required game files check"""
+    if present is None:
+        # Directory not listable - fall back to access(), which skips filling a stat buffer
+        present = {file for file in _REQUIRED_FILES if os.access(file, os.F_OK)}
+
+    # Common case: everything is there, no need to work out what is missing
+    if present.issuperset(_REQUIRED_FILES):
+        _prefetch_files(_REQUIRED_FILES)
+        return True, _FOUND_MESSAGES
+    
+    messages = [message for file, message in zip(_REQUIRED_FILES, _FOUND_MESSAGES) if file in present]
+    messages.append("❌ Error: Missing required files:")
+    for file in _REQUIRED_FILES:
+        if file not in present:
+            messages.append(f"   - {file}")
+    return False, tuple(messages)
+
+def _prefetch_files(paths):
+    """Ask the kernel to start reading files we are about to import"""
+    if not hasattr(os, 'posix_fadvise'):
+        return  # Not available on Windows
     
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+def _write_lines(lines):
+    """Write several lines to stdout with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def _report(probe, *args):
+    """Print the messages of a cached probe and return its result"""
+    ok, messages = probe(*args)
+    _write_lines(messages)
+    return ok
+
+def check_python_version():
+    """Check if Python version is sufficient"""
+    return _report(_probe_python_version)
+
+def check_pygame():
+    """Check if Pygame is installed"""
+    return _report(_probe_pygame)
+
+def check_game_files(present_files=None):
+    """Check if all required game files exist"""
+    if present_files is None:
+        present_files = _inventory()[0]
+    return _report(_probe_game_files, present_files)
+
+def create_assets_folder(existing_dirs=None):
+    """Create assets folder structure if it doesn't exist"""
+    # Existing layout comes from a snapshot; makedirs(exist_ok=True) handles the rest
+    if existing_dirs is None:
+        existing_dirs = _inventory()[1]
+
     created_dirs = []
-    for dir_path in asset_dirs:
-        if not os.path.exists(dir_path):
-            try:
-                os.makedirs(dir_path, exist_ok=True)
-                created_dirs.append(dir_path)
-            except OSError as e:
-                print(f"⚠️  Warning: Could not create {dir_path}: {e}")
+    for dir_path in _ASSET_DIRS:
+        try:
+            os.makedirs(dir_path, exist_ok=True)
+        except OSError as e:
+            print(f"⚠️  Warning: Could not create {dir_path}: {e}")
+            continue
+        if dir_path not in existing_dirs:
+            created_dirs.append(dir_path)
     
     if created_dirs:
-        print(f"📁 Created asset directories: {', '.join(created_dirs)}")
-        print("   Add custom sprites, sounds, and fonts to enhance the game!")
+        _write_lines((f"📁 Created asset directories: {', '.join(created_dirs)}", _ASSET_HINT))
     else:
         print("📁 Asset directories already exist")
 
 def run_game():
     """Run the main game"""
     try:
-        print("\n🎮 Starting Halloween Haunt: Candy Quest...")
-        print("   Press F11 for fullscreen, ESC for pause menu")
-        print("   Use WASD/arrows to move, SPACE to interact")
-        print("   Collect 15 candies and return home to win each level!")
-        print("\n" + "="*50)
+        import pygame  # halloween_haunt runs pygame.init() itself on import
+        _write_lines((f"✅ Pygame {pygame.version.ver} is ready",) + _GAME_INSTRUCTIONS)
         
         # Import and run the main game
         from halloween_haunt import main
         main()
         
     except ImportError as e:
-        print(f"❌ Error importing game modules: {e}")
-        print("   Make sure all game files are in the same directory")
+        _write_lines((
+            f"❌ Error importing game modules: {e}",
+            "   Make sure all game files are in the same directory",
+        ))
         return False
     except Exception as e:
         print(f"❌ Error running game: {e}")
@@ -114,26 +217,26 @@ def run_game():
 
 def main():
     """Main demo launcher"""
-    print("🎃 Halloween Haunt: Candy Quest - Demo Launcher 🎃")
-    print("                    BETA VERSION")
-    print("="*50)
-    
-    # Check system requirements
-    print("\n🔍 Checking system requirements...")
+    _write_lines(_LAUNCHER_BANNER)
     
+    # Cheapest check first, so an unsupported Python fails before any I/O
     if not check_python_version():
         return
     
+    # One scan of the game folder serves both the file check and asset setup
+    present_files, existing_asset_dirs = _inventory()
+    
     if not check_pygame():
         return
     
-    print("\n📋 Checking game files...")
-    
-    if not check_game_files():
+    # Section header and file results go out in one write
+    files_ok, messages = _probe_game_files(present_files)
+    _write_lines((_GAME_FILES_HEADER,) + messages)
+    if not files_ok:
         return
     
     print("\n📁 Setting up assets...")
-    create_assets_folder()
+    create_assets_folder(existing_asset_dirs)
     
     print("\n✅ All checks passed! Ready to play!")
     
@@ -5,7 +5,8 @@ Core game entity classes for Halloween Haunt: Candy Quest
 import pygame
 import math
 import random
-import os
+import functools
+from itertools import compress, repeat
 from typing import List, Tuple, Optional
 from halloween_haunt import (
     TILE_SIZE, PLAYER_MAX_SPEED, PLAYER_ACCELERATION, PLAYER_DECELERATION,
@@ -13,12 +14,72 @@ from halloween_haunt import (
     PLAYER_MAX_HEALTH, INVINCIBILITY_DURATION,
     WHITE, BLACK, ORANGE, GRAY, RED, GREEN, BLUE, BROWN, DARK_GRAY, YELLOW, PURPLE,
     TileType, PowerUp, PowerUpType, Particle,
-    asset_manager, camera
+    asset_manager, asset_exists, camera, particle_pool
 )
 
+# Squared radii for the ghost state checks, so they can skip the sqrt
+GHOST_DETECTION_R2 = GHOST_DETECTION_RADIUS ** 2
+GHOST_DETECTION_R2_LOSE = (GHOST_DETECTION_RADIUS * 1.5) ** 2
+GHOST_RETURN_R2 = 20 * 20
+
+def _build_ghost_body_table(num_points: int = 20) -> Tuple[Tuple[float, float, Optional[float]], ...]:
+    """Unit (x, y) offsets of the ghost outline, plus the wave phase for wavy bottom points"""
+    table = []
+    for i in range(num_points):
+        angle = (i / num_points) * 2 * math.pi
+        # Irregular, flowing shape
+        unit_x = (0.8 + 0.3 * math.sin(angle * 2)) * math.cos(angle)
+        unit_y = (0.9 + 0.2 * math.cos(angle * 3)) * math.sin(angle)
+        # Bottom edge gets an animated wave on top of this
+        wave_phase = angle * 4 if math.pi * 0.6 < angle < math.pi * 1.4 else None
+        table.append((unit_x, unit_y, wave_phase))
+    return tuple(table)
+
+# Static vertex tables for the ghost, so draw() only evaluates the animated wave
+_GHOST_BODY_TABLE = _build_ghost_body_table()
+_GHOST_FROWN_OFFSETS = tuple((i - 3, -math.sin((i / 6) * math.pi) * 2) for i in range(7))
+
+# Chase pulse is quantised to these scales so the scaled surfaces can be reused
+_GHOST_PULSE_SCALES = tuple(0.8 + 0.2 * i / 7 for i in range(8))
+
+_TWO_PI = 2 * math.pi
+
+# Candy glow intensity over one sine period, sampled at 256 phases; the glow
+# phase advances 0.1 rad per frame, i.e. _CANDY_GLOW_STEP table entries
+_CANDY_GLOW_LUT = tuple(int(50 + 30 * math.sin(i * _TWO_PI / 256)) for i in range(256))
+_CANDY_GLOW_STEP = 0.1 * 256 / _TWO_PI
+
+# Easter egg glow phase advances 0.15 rad per frame, in 16ths of a period
+_EGG_GLOW_STEP = 0.15 * 16 / _TWO_PI
+
+# Easter egg rewards by keyword, in match order ("double points" before "points");
+# values are (power-up, duration in frames), None for the non-power-up rewards
+_EGG_REWARD_TABLE = {
+    "health": None,
+    "magnet": (PowerUpType.CANDY_MAGNET, 600),  # 10 seconds
+    "repel": (PowerUpType.GHOST_REPEL, 900),  # 15 seconds
+    "speed": (PowerUpType.SPEED_BOOST, 420),  # 7 seconds
+    "invisibility": (PowerUpType.INVISIBILITY, 720),  # 12 seconds
+    "time slow": (PowerUpType.TIME_SLOW, 480),  # 8 seconds
+    "double points": (PowerUpType.DOUBLE_POINTS, 600),  # 10 seconds
+    "shield": (PowerUpType.SHIELD, 900),  # 15 seconds
+    "points": None,
+}
+
+@functools.lru_cache(maxsize=8)
+def _effect_dot(color: Tuple[int, int, int], radius: int) -> pygame.Surface:
+    """Small pre-rendered circle for batching power-up particles through Surface.blits"""
+    surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (radius, radius), radius)
+    return surface
+
 class Player:
     """Player character - young trick-or-treater in ghost costume"""
     
+    # Pre-rendered body surfaces keyed by body color, plus the shared shadow
+    _body_cache = {}
+    _shadow_surface = None
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -31,10 +92,11 @@ class Player:
         
         # Visual properties
         self.radius = 12
-        self.facing_direction = 0  # radians
         
-        # Power-ups
-        self.active_powerups: List[PowerUp] = []
+        # Power-ups: frames remaining for each PowerUpType, indexed by its value
+        self.powerup_timers: List[int] = [0] * len(PowerUpType)
+        # Bit (1 << value) set for each running power-up, for cheap per-frame checks
+        self.active_powerup_mask = 0
         
         # Initialize power-up states
         self.invisibility_active = False
@@ -55,60 +117,31 @@ class Player:
     
     def update(self, keys_pressed: pygame.key.ScancodeWrapper, tile_map: 'TileMap'):
         """Update player movement and state"""
-        # Handle input for movement
-        acceleration_x = 0.0
-        acceleration_y = 0.0
-        
-        if keys_pressed[pygame.K_a] or keys_pressed[pygame.K_LEFT]:
-            acceleration_x = -PLAYER_ACCELERATION
-        if keys_pressed[pygame.K_d] or keys_pressed[pygame.K_RIGHT]:
-            acceleration_x = PLAYER_ACCELERATION
-        if keys_pressed[pygame.K_w] or keys_pressed[pygame.K_UP]:
-            acceleration_y = -PLAYER_ACCELERATION
-        if keys_pressed[pygame.K_s] or keys_pressed[pygame.K_DOWN]:
-            acceleration_y = PLAYER_ACCELERATION
-            
-
-        
-        # Apply acceleration
-        self.vx += acceleration_x
-        self.vy += acceleration_y
+        # Handle input for movement (opposite keys cancel out)
+        acceleration_x = (int(keys_pressed[pygame.K_d] or keys_pressed[pygame.K_RIGHT]) -
+                          int(keys_pressed[pygame.K_a] or keys_pressed[pygame.K_LEFT])) * PLAYER_ACCELERATION
+        acceleration_y = (int(keys_pressed[pygame.K_s] or keys_pressed[pygame.K_DOWN]) -
+                          int(keys_pressed[pygame.K_w] or keys_pressed[pygame.K_UP])) * PLAYER_ACCELERATION
         
-        # Apply deceleration when no input
-        if acceleration_x == 0:
-            self.vx *= (1.0 - PLAYER_DECELERATION)
-        if acceleration_y == 0:
-            self.vy *= (1.0 - PLAYER_DECELERATION)
+        # Apply acceleration, or deceleration when there is no input on an axis
+        self.vx = (self.vx + acceleration_x) * (1.0 if acceleration_x else 1.0 - PLAYER_DECELERATION)
+        self.vy = (self.vy + acceleration_y) * (1.0 if acceleration_y else 1.0 - PLAYER_DECELERATION)
         
         # Apply speed modifiers from power-ups
-        speed_multiplier = 1.0
-        invisibility_active = False
-        time_slow_active = False
-        double_points_active = False
-        shield_active = False
-        
-        for powerup in self.active_powerups:
-            if powerup.type == PowerUpType.SPEED_BOOST:
-                speed_multiplier *= 1.5
-            elif powerup.type == PowerUpType.INVISIBILITY:
-                invisibility_active = True
-            elif powerup.type == PowerUpType.TIME_SLOW:
-                time_slow_active = True
-            elif powerup.type == PowerUpType.DOUBLE_POINTS:
-                double_points_active = True
-            elif powerup.type == PowerUpType.SHIELD:
-                shield_active = True
+        timers = self.powerup_timers
+        speed_multiplier = 1.5 if timers[PowerUpType.SPEED_BOOST.value] > 0 else 1.0
         
         # Store power-up states for external access
-        self.invisibility_active = invisibility_active
-        self.time_slow_active = time_slow_active
-        self.double_points_active = double_points_active
-        self.shield_active = shield_active
+        self.invisibility_active = timers[PowerUpType.INVISIBILITY.value] > 0
+        self.time_slow_active = timers[PowerUpType.TIME_SLOW.value] > 0
+        self.double_points_active = timers[PowerUpType.DOUBLE_POINTS.value] > 0
+        self.shield_active = timers[PowerUpType.SHIELD.value] > 0
         
         # Limit maximum speed
         max_speed = PLAYER_MAX_SPEED * speed_multiplier
-        speed = math.sqrt(self.vx ** 2 + self.vy ** 2)
-        if speed > max_speed:
+        speed_sq = self.vx * self.vx + self.vy * self.vy
+        if speed_sq > max_speed * max_speed:
+            speed = math.sqrt(speed_sq)
             self.vx = (self.vx / speed) * max_speed
             self.vy = (self.vy / speed) * max_speed
         
@@ -131,10 +164,6 @@ class Player:
         self.rect.centerx = int(self.x)
         self.rect.centery = int(self.y)
         
-        # Update facing direction
-        if abs(self.vx) > 0.1 or abs(self.vy) > 0.1:
-            self.facing_direction = math.atan2(self.vy, self.vx)
-        
         # Update invincibility timer
         if self.invincible_timer > 0:
             self.invincible_timer -= 1
@@ -144,28 +173,23 @@ class Player:
     
     def _check_wall_collision(self, x: float, y: float, tile_map: 'TileMap') -> bool:
         """Check if position would collide with walls"""
-        # Get tile coordinates for player's corners
-        corners = [
-            (x - self.radius, y - self.radius),  # Top-left
-            (x + self.radius, y - self.radius),  # Top-right
-            (x - self.radius, y + self.radius),  # Bottom-left
-            (x + self.radius, y + self.radius)   # Bottom-right
-        ]
-        
-        for corner_x, corner_y in corners:
-            tile_x = int(corner_x // TILE_SIZE)
-            tile_y = int(corner_y // TILE_SIZE)
-            
-            if tile_map.is_solid_tile(tile_x, tile_y):
-                return True
-        
-        return False
+        return tile_map.is_solid_rect(x - self.radius, y - self.radius,
+                                      x + self.radius, y + self.radius)
     
     def _update_powerups(self):
         """Update active power-up effects"""
-        self.active_powerups = [p for p in self.active_powerups if p.duration > 0]
-        for powerup in self.active_powerups:
-            powerup.duration -= 1
+        timers = self.powerup_timers
+        for index, remaining in enumerate(timers):
+            if remaining > 0:
+                timers[index] = remaining - 1
+                if remaining == 1:
+                    self.active_powerup_mask &= ~(1 << index)  # Just expired
+    
+    @property
+    def active_powerups(self) -> List[PowerUp]:
+        """Currently active power-ups, built from the timers for display"""
+        return [PowerUp(powerup_type, self.powerup_timers[powerup_type.value])
+                for powerup_type in PowerUpType if self.powerup_timers[powerup_type.value] > 0]
     
     def take_damage(self) -> bool:
         """Take damage if not invincible and not shielded. Returns True if damage taken."""
@@ -183,12 +207,13 @@ class Player:
         self.score += actual_points
     
     def add_powerup(self, powerup_type: PowerUpType, duration: int):
-        """Add a power-up effect"""
-        # Remove existing powerup of same type
-        self.active_powerups = [p for p in self.active_powerups if p.type != powerup_type]
-        
-        # Add new powerup
-        self.active_powerups.append(PowerUp(powerup_type, duration))
+        """Add a power-up effect, replacing any running one of the same type"""
+        self.powerup_timers[powerup_type.value] = duration
+        bit = 1 << powerup_type.value
+        if duration > 0:
+            self.active_powerup_mask |= bit
+        else:
+            self.active_powerup_mask &= ~bit
     
     def heal(self, amount: int = 1):
         """Heal the player"""
@@ -196,6 +221,9 @@ class Player:
     
     def draw(self, screen: pygame.Surface):
         """Draw the player with improved, non-square ghost design"""
+        if not camera.is_visible(self.x, self.y, self.radius * 3):
+            return
+        
         screen_x = int(self.x - camera.x)
         screen_y = int(self.y - camera.y)
         
@@ -209,116 +237,150 @@ class Player:
             if self.invincible_timer > 0 and (self.invincible_timer // 5) % 2:
                 color = (200, 200, 255)  # Slight blue tint when invincible
             
-            # Main ghost body - smooth, rounded shape (not square!)
-            body_width = 18
-            body_height = 22
-            
-            # Create a smooth elliptical body
-            body_points = []
-            num_points = 16
-            for i in range(num_points):
-                angle = (i / num_points) * 2 * math.pi
-                # Elliptical shape with slight point at bottom
-                if angle > math.pi * 0.8 and angle < math.pi * 1.2:  # Bottom area
-                    radius_x = body_width * 0.7
-                    radius_y = body_height * 0.8
-                else:
-                    radius_x = body_width
-                    radius_y = body_height
-                
-                x_offset = radius_x * math.cos(angle)
-                y_offset = radius_y * math.sin(angle)
-                
-                # Add slight wave to bottom for wavy edge
-                if angle > math.pi * 0.7 and angle < math.pi * 1.3:
-                    wave = 2 * math.sin(angle * 3)
-                    y_offset += wave
-                
-                body_points.append((screen_x + x_offset, screen_y + y_offset))
-            
-            pygame.draw.polygon(screen, color, body_points)
-            
-            # Smooth outline
-            pygame.draw.polygon(screen, BLACK, body_points, 1)
-            
-            # Large, expressive eyes (not tiny dots)
-            eye_y = screen_y - 2
-            eye_size = 4
-            
-            # Left eye with shine
-            pygame.draw.circle(screen, BLACK, (screen_x - 6, eye_y), eye_size)
-            pygame.draw.circle(screen, WHITE, (screen_x - 5, eye_y - 1), 2)  # Eye shine
-            pygame.draw.circle(screen, (255, 255, 255, 150), (screen_x - 4, eye_y - 2), 1)  # Extra shine
-            
-            # Right eye with shine
-            pygame.draw.circle(screen, BLACK, (screen_x + 6, eye_y), eye_size)
-            pygame.draw.circle(screen, WHITE, (screen_x + 7, eye_y - 1), 2)  # Eye shine
-            pygame.draw.circle(screen, (255, 255, 255, 150), (screen_x + 8, eye_y - 2), 1)  # Extra shine
-            
-            # Friendly mouth (not just a circle)
-            mouth_center_y = screen_y + 4
-            mouth_width = 8
-            mouth_height = 3
-            
-            # Draw a gentle smile curve
-            mouth_points = []
-            for i in range(mouth_width + 1):
-                x = screen_x - mouth_width//2 + i
-                # Create a smile curve using sine wave
-                smile_offset = math.sin((i / mouth_width) * math.pi) * mouth_height
-                y = mouth_center_y + smile_offset
-                mouth_points.append((x, y))
+            # Body, eyes and mouth are static, so they are rendered once per color
+            body_surface = Player._body_cache.get(color)
+            if body_surface is None:
+                body_surface = Player._body_cache[color] = self._render_body(color)
+            screen.blit(body_surface, (screen_x - 24, screen_y - 26))
             
-            pygame.draw.lines(screen, BLACK, False, mouth_points, 2)
-            
-            # Add power-up visual effects
+            # Add power-up visual effects (the screen has no per-pixel alpha, so colors are plain RGB)
             time_factor = pygame.time.get_ticks() * 0.001
             
+            # Particles are collected into one list and drawn with a single blits() call
+            effect_blits = []
+            
             # Invisibility effect - semi-transparent with particles
             if self.invisibility_active:
                 # Create invisibility particles
+                particle = _effect_dot((200, 200, 255), 2)
                 for i in range(3):
                     angle = time_factor * 2 + i * math.pi * 2 / 3
                     radius = 25 + 5 * math.sin(time_factor * 3 + i)
                     particle_x = screen_x + int(radius * math.cos(angle))
                     particle_y = screen_y + int(radius * math.sin(angle) * 0.5)
-                    particle_color = (200, 200, 255, 150)
-                    pygame.draw.circle(screen, particle_color, (particle_x, particle_y), 2)
+                    effect_blits.append((particle, (particle_x - 2, particle_y - 2)))
             
             # Time slow effect - clock-like particles
             if self.time_slow_active:
                 # Create clock hand particles
+                clock_dot = _effect_dot((100, 200, 255), 1)
                 for i in range(4):
                     angle = time_factor * 0.5 + i * math.pi / 2
                     radius = 20
                     clock_x = screen_x + int(radius * math.cos(angle))
                     clock_y = screen_y + int(radius * math.sin(angle))
-                    clock_color = (100, 200, 255, 180)
-                    pygame.draw.circle(screen, clock_color, (clock_x, clock_y), 1)
+                    effect_blits.append((clock_dot, (clock_x - 1, clock_y - 1)))
             
             # Shield effect - protective aura
             if self.shield_active:
                 # Create shield aura
                 shield_radius = self.radius + 8 + 3 * math.sin(time_factor * 4)
-                shield_color = (100, 200, 255, 100)
+                shield_color = (100, 200, 255)
                 pygame.draw.circle(screen, shield_color, (screen_x, screen_y), int(shield_radius), 2)
                 # Add shield sparkles
+                sparkle = _effect_dot((150, 220, 255), 1)
+                sparkle_radius = self.radius + 6
                 for i in range(6):
                     angle = time_factor * 3 + i * math.pi / 3
-                    sparkle_radius = self.radius + 6
                     sparkle_x = screen_x + int(sparkle_radius * math.cos(angle))
                     sparkle_y = screen_y + int(sparkle_radius * math.sin(angle))
-                    pygame.draw.circle(screen, (150, 220, 255), (sparkle_x, sparkle_y), 1)
+                    effect_blits.append((sparkle, (sparkle_x - 1, sparkle_y - 1)))
+            
+            if effect_blits:
+                screen.blits(effect_blits, doreturn=False)
             
             # Add subtle shadow under the ghost
-            shadow_color = (0, 0, 0, 50)
-            shadow_surface = pygame.Surface((body_width * 2, 8), pygame.SRCALPHA)
-            pygame.draw.ellipse(shadow_surface, shadow_color, (0, 0, body_width * 2, 8))
-            screen.blit(shadow_surface, (screen_x - body_width, screen_y + body_height - 2))
+            if Player._shadow_surface is None:
+                Player._shadow_surface = pygame.Surface((36, 8), pygame.SRCALPHA)
+                pygame.draw.ellipse(Player._shadow_surface, (0, 0, 0, 50), (0, 0, 36, 8))
+            screen.blit(Player._shadow_surface, (screen_x - 18, screen_y + 20))
+    
+    @staticmethod
+    def _render_body(color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render the ghost body, eyes and mouth centred on a 48x52 surface"""
+        surface = pygame.Surface((48, 52), pygame.SRCALPHA)
+        center_x, center_y = 24, 26
+        
+        # Main ghost body - smooth, rounded shape (not square!)
+        body_width = 18
+        body_height = 22
+        
+        # Create a smooth elliptical body
+        body_points = []
+        num_points = 16
+        for i in range(num_points):
+            angle = (i / num_points) * 2 * math.pi
+            # Elliptical shape with slight point at bottom
+            if angle > math.pi * 0.8 and angle < math.pi * 1.2:  # Bottom area
+                radius_x = body_width * 0.7
+                radius_y = body_height * 0.8
+            else:
+                radius_x = body_width
+                radius_y = body_height
+            
+            x_offset = radius_x * math.cos(angle)
+            y_offset = radius_y * math.sin(angle)
+            
+            # Add slight wave to bottom for wavy edge
+            if angle > math.pi * 0.7 and angle < math.pi * 1.3:
+                wave = 2 * math.sin(angle * 3)
+                y_offset += wave
+            
+            body_points.append((center_x + x_offset, center_y + y_offset))
+        
+        pygame.draw.polygon(surface, color, body_points)
+        
+        # Smooth outline
+        pygame.draw.polygon(surface, BLACK, body_points, 1)
+        
+        # Large, expressive eyes (not tiny dots)
+        eye_y = center_y - 2
+        eye_size = 4
+        
+        # Left eye with shine
+        pygame.draw.circle(surface, BLACK, (center_x - 6, eye_y), eye_size)
+        pygame.draw.circle(surface, WHITE, (center_x - 5, eye_y - 1), 2)  # Eye shine
+        pygame.draw.circle(surface, WHITE, (center_x - 4, eye_y - 2), 1)  # Extra shine
+        
+        # Right eye with shine
+        pygame.draw.circle(surface, BLACK, (center_x + 6, eye_y), eye_size)
+        pygame.draw.circle(surface, WHITE, (center_x + 7, eye_y - 1), 2)  # Eye shine
+        pygame.draw.circle(surface, WHITE, (center_x + 8, eye_y - 2), 1)  # Extra shine
+        
+        # Friendly mouth (not just a circle)
+        mouth_center_y = center_y + 4
+        mouth_width = 8
+        mouth_height = 3
+        
+        # Draw a gentle smile curve
+        mouth_points = []
+        for i in range(mouth_width + 1):
+            x = center_x - mouth_width//2 + i
+            # Create a smile curve using sine wave
+            smile_offset = math.sin((i / mouth_width) * math.pi) * mouth_height
+            y = mouth_center_y + smile_offset
+            mouth_points.append((x, y))
+        
+        pygame.draw.lines(surface, BLACK, False, mouth_points, 2)
+        
+        return surface
 
 class Ghost:
     """Enemy ghost that patrols and chases the player"""
     
+    # Fixed attribute layout: no per-ghost __dict__, and faster field access in update()
+    __slots__ = (
+        'x', 'y', 'start_x', 'start_y', 'vx', 'vy',
+        'state', 'patrol_points', 'current_patrol_target', 'chase_timer',
+        'radius', 'alpha', 'sprite', 'rect',
+        'frozen_timer', 'original_vx', 'original_vy'  # Set by the ghost freeze power-up
+    )
+    
+    # Reusable destination surfaces for the chase pulse, keyed by (width, height, pulse level)
+    _pulse_surfaces = {}
+    _scratch_surfaces = {}  # Keyed by side length
+    _frown_stamp = None
+    
     def __init__(self, x: float, y: float, patrol_points: List[Tuple[float, float]] = None):
         self.x = x
         self.y = y
@@ -350,40 +412,37 @@ class Ghost:
     
     def update(self, player: Player, tile_map: 'TileMap'):
         """Update ghost AI and movement"""
-        # Store player reference for movement methods
-        self._player_ref = player
-        
         # Check if player is nearby for chasing
-        distance_to_player = math.sqrt(
-            (self.x - player.x) ** 2 + (self.y - player.y) ** 2
-        )
+        dx = player.x - self.x
+        dy = player.y - self.y
+        distance_to_player_sq = dx * dx + dy * dy
         
         # State management (respect player power-ups)
         started_chasing = False
         if self.state == "patrol":
             # Don't detect invisible player
-            if distance_to_player <= GHOST_DETECTION_RADIUS and not player.invisibility_active:
+            if distance_to_player_sq <= GHOST_DETECTION_R2 and not player.invisibility_active:
                 self.state = "chase"
                 self.chase_timer = 300  # 5 seconds at 60 FPS
                 started_chasing = True
         elif self.state == "chase":
             self.chase_timer -= 1
-            if self.chase_timer <= 0 or distance_to_player > GHOST_DETECTION_RADIUS * 1.5:
+            if self.chase_timer <= 0 or distance_to_player_sq > GHOST_DETECTION_R2_LOSE:
                 self.state = "return"
         elif self.state == "return":
-            distance_to_start = math.sqrt(
-                (self.x - self.start_x) ** 2 + (self.y - self.start_y) ** 2
-            )
-            if distance_to_start < 20:
+            start_dx = self.start_x - self.x
+            start_dy = self.start_y - self.y
+            if start_dx * start_dx + start_dy * start_dy < GHOST_RETURN_R2:
                 self.state = "patrol"
         
-        # Movement based on state
+        # Movement based on state (time slow drops ghosts to 40% speed)
+        speed_scale = 0.4 if player.time_slow_active else 1.0
         if self.state == "chase":
-            self._chase_player(player)
+            self._chase_player(dx, dy, speed_scale)
         elif self.state == "return":
-            self._return_to_start()
+            self._return_to_start(speed_scale)
         else:
-            self._patrol()
+            self._patrol(speed_scale)
         
         # Apply movement
         new_x = self.x + self.vx
@@ -401,40 +460,31 @@ class Ghost:
         
         return started_chasing
     
-    def _chase_player(self, player: Player):
-        """Chase the player"""
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance = math.sqrt(dx ** 2 + dy ** 2)
-        
-        if distance > 0:
-            speed = GHOST_CHASE_SPEED
-            # Apply time slow effect
-            if player.time_slow_active:
-                speed *= 0.4  # Slow down to 40% speed
-            
-            self.vx = (dx / distance) * speed
-            self.vy = (dy / distance) * speed
+    def _chase_player(self, dx: float, dy: float, speed_scale: float = 1.0):
+        """Chase the player, given the offset from this ghost to them"""
+        distance_sq = dx * dx + dy * dy
+        
+        if distance_sq > 0:
+            # Fold normalisation and speed into one factor
+            scale = GHOST_CHASE_SPEED * speed_scale / math.sqrt(distance_sq)
+            self.vx = dx * scale
+            self.vy = dy * scale
     
-    def _return_to_start(self):
+    def _return_to_start(self, speed_scale: float = 1.0):
         """Return to starting position"""
         dx = self.start_x - self.x
         dy = self.start_y - self.y
-        distance = math.sqrt(dx ** 2 + dy ** 2)
+        distance_sq = dx * dx + dy * dy
         
-        if distance > 0:
-            speed = GHOST_SPEED
-            # Apply time slow effect
-            if self._player_ref and self._player_ref.time_slow_active:
-                speed *= 0.4  # Slow down to 40% speed
-            
-            self.vx = (dx / distance) * speed
-            self.vy = (dy / distance) * speed
+        if distance_sq > 0:
+            scale = GHOST_SPEED * speed_scale / math.sqrt(distance_sq)
+            self.vx = dx * scale
+            self.vy = dy * scale
         else:
             self.vx = 0
             self.vy = 0
     
-    def _patrol(self):
+    def _patrol(self, speed_scale: float = 1.0):
         """Patrol between waypoints"""
         if not self.patrol_points:
             self.vx = 0
@@ -444,20 +494,16 @@ class Ghost:
         target_x, target_y = self.patrol_points[self.current_patrol_target]
         dx = target_x - self.x
         dy = target_y - self.y
-        distance = math.sqrt(dx ** 2 + dy ** 2)
+        distance_sq = dx * dx + dy * dy
         
-        if distance < 10:
+        if distance_sq < 10 * 10:
             # Reached patrol point, move to next
             self.current_patrol_target = (self.current_patrol_target + 1) % len(self.patrol_points)
         else:
             # Move toward current patrol point
-            speed = GHOST_SPEED
-            # Apply time slow effect
-            if hasattr(self, '_player_ref') and self._player_ref and self._player_ref.time_slow_active:
-                speed *= 0.4  # Slow down to 40% speed
-            
-            self.vx = (dx / distance) * speed
-            self.vy = (dy / distance) * speed
+            scale = GHOST_SPEED * speed_scale / math.sqrt(distance_sq)
+            self.vx = dx * scale
+            self.vy = dy * scale
     
     def _check_wall_collision(self, x: float, y: float, tile_map: 'TileMap') -> bool:
         """Check collision with solid walls"""
@@ -467,6 +513,9 @@ class Ghost:
     
     def draw(self, screen: pygame.Surface):
         """Draw the ghost with improved, menacing design"""
+        if not camera.is_visible(self.x, self.y, self.radius * 3):
+            return
+        
         screen_x = int(self.x - camera.x)
         screen_y = int(self.y - camera.y)
         
@@ -482,32 +531,31 @@ class Ghost:
             ghost_color = (100, 100, 150) if self.state != "chase" else (150, 80, 80)
             outline_color = (50, 50, 100) if self.state != "chase" else (100, 40, 40)
             
-            # Create ghost surface with transparency
-            ghost_surface = pygame.Surface((self.radius * 3, self.radius * 3), pygame.SRCALPHA)
+            # Ghosts draw one at a time, so each size shares a cleared scratch surface
+            size = self.radius * 3
+            ghost_surface = Ghost._scratch_surfaces.get(size)
+            if ghost_surface is None:
+                ghost_surface = Ghost._scratch_surfaces[size] = pygame.Surface((size, size), pygame.SRCALPHA)
+            else:
+                ghost_surface.fill((0, 0, 0, 0))
             
             # Main ghost body - smooth, flowing shape (not blocky!)
             body_width = self.radius * 1.8
             body_height = self.radius * 2.2
             
-            # Create flowing body shape using ellipse with distortion
+            # Create flowing body shape from the precomputed outline table
+            center = self.radius * 1.5
+            ticks = pygame.time.get_ticks()  # One clock read drives both the wave and the pulse
+            wave_time = ticks * 0.01
             body_points = []
-            num_points = 20
-            for i in range(num_points):
-                angle = (i / num_points) * 2 * math.pi
-                
-                # Create irregular, flowing shape
-                radius_x = body_width * (0.8 + 0.3 * math.sin(angle * 2))
-                radius_y = body_height * (0.9 + 0.2 * math.cos(angle * 3))
+            for unit_x, unit_y, wave_phase in _GHOST_BODY_TABLE:
+                radius_y = body_height
                 
                 # Add more distortion for bottom wavy edge
-                if angle > math.pi * 0.6 and angle < math.pi * 1.4:
-                    wave_distortion = 0.4 * math.sin(angle * 4 + pygame.time.get_ticks() * 0.01)
-                    radius_y *= (1 + wave_distortion)
-                
-                x_offset = radius_x * math.cos(angle)
-                y_offset = radius_y * math.sin(angle)
+                if wave_phase is not None:
+                    radius_y *= 1 + 0.4 * math.sin(wave_phase + wave_time)
                 
-                body_points.append((self.radius * 1.5 + x_offset, self.radius * 1.5 + y_offset))
+                body_points.append((center + body_width * unit_x, center + radius_y * unit_y))
             
             pygame.draw.polygon(ghost_surface, (*ghost_color, self.alpha), body_points)
             
@@ -537,20 +585,12 @@ class Ghost:
             pygame.draw.circle(ghost_surface, eye_color, 
                              (int(self.radius * 1.5 + 5), int(eye_y)), eye_size)
             
-            # Frown mouth (scary!)
-            mouth_y = self.radius * 1.5 + 4
-            mouth_width = 6
-            
-            # Create a frown curve
-            frown_points = []
-            for i in range(mouth_width + 1):
-                x = self.radius * 1.5 - mouth_width//2 + i
-                # Create a frown using inverted sine wave
-                frown_offset = -math.sin((i / mouth_width) * math.pi) * 2
-                y = mouth_y + frown_offset
-                frown_points.append((x, y))
-            
-            pygame.draw.lines(ghost_surface, (50, 50, 50, self.alpha), False, frown_points, 2)
+            # Frown mouth (scary!), stamped from a pre-rendered surface
+            if Ghost._frown_stamp is None:
+                Ghost._frown_stamp = pygame.Surface((9, 6), pygame.SRCALPHA)
+                frown_points = [(4 + dx, 3 + dy) for dx, dy in _GHOST_FROWN_OFFSETS]
+                pygame.draw.lines(Ghost._frown_stamp, (50, 50, 50), False, frown_points, 2)
+            ghost_surface.blit(Ghost._frown_stamp, (center - 4, center + 4 - 3))
             
             # Add wispy trailing effects when moving
             if abs(self.vx) > 0.5 or abs(self.vy) > 0.5:
@@ -568,9 +608,16 @@ class Ghost:
             
             # Add pulsing effect when chasing
             if self.state == "chase":
-                pulse = math.sin(pygame.time.get_ticks() * 0.02) * 0.1 + 0.9
-                scaled_surface = pygame.transform.scale(ghost_surface, 
-                    (int(ghost_surface.get_width() * pulse), int(ghost_surface.get_height() * pulse)))
+                pulse_level = round((math.sin(ticks * 0.02) + 1) * 3.5)
+                width, height = ghost_surface.get_size()
+                key = (width, height, pulse_level)
+                scaled_surface = Ghost._pulse_surfaces.get(key)
+                if scaled_surface is None:
+                    pulse = _GHOST_PULSE_SCALES[pulse_level]
+                    scaled_surface = pygame.Surface((int(width * pulse), int(height * pulse)), pygame.SRCALPHA)
+                    Ghost._pulse_surfaces[key] = scaled_surface
+                # Scale into the reused surface instead of allocating a new one every frame
+                pygame.transform.scale(ghost_surface, scaled_surface.get_size(), scaled_surface)
                 scaled_rect = scaled_surface.get_rect(center=(screen_x, screen_y))
                 screen.blit(scaled_surface, scaled_rect)
             else:
@@ -579,6 +626,12 @@ class Ghost:
 class Candy:
     """Collectible candy scattered around the map"""
     
+    # Fixed attribute layout, as for Ghost: levels hold many candies updated every frame
+    __slots__ = ('x', 'y', 'type', 'points', 'collected', 'radius', 'glow_timer', 'sprite', 'rect')
+    
+    # Pre-rendered glow + candy surfaces keyed by (type, radius, glow intensity, face visible)
+    _sprite_cache = {}
+    
     def __init__(self, x: float, y: float, candy_type: str = "normal", points: int = 10):
         self.x = x
         self.y = y
@@ -613,9 +666,10 @@ class Candy:
         """Update candy animation"""
         self.glow_timer += 1
     
-    def collect(self, player: Player) -> List[Particle]:
-        """Collect this candy and apply effects"""
-        particles = []
+    def collect(self, player: Player, particles: Optional[List[Particle]] = None) -> List[Particle]:
+        """Collect this candy and apply effects, appending its particles to particles if given"""
+        if particles is None:
+            particles = []
         
         if not self.collected:
             self.collected = True
@@ -630,13 +684,14 @@ class Candy:
                 player.score += self.points  # Double points
                 player.heal(1)
             
-            # Create pickup particles
+            # Create pickup particles (random.random() scaled directly is cheaper than uniform())
+            rand = random.random
             for _ in range(8):
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(1, 3)
+                angle = rand() * _TWO_PI
+                speed = 1 + 2 * rand()
                 vx = math.cos(angle) * speed
                 vy = math.sin(angle) * speed
-                particles.append(Particle(
+                particles.append(particle_pool.acquire(
                     self.x, self.y, vx, vy, YELLOW, 30
                 ))
         
@@ -644,91 +699,176 @@ class Candy:
     
     def draw(self, screen: pygame.Surface):
         """Draw the candy with glow effect"""
-        if self.collected:
+        if self.collected or not camera.is_visible(self.x, self.y, self.radius * 3):
             return
         
         screen_x = int(self.x - camera.x)
         screen_y = int(self.y - camera.y)
         
-        # Draw glow effect
-        glow_intensity = int(50 + 30 * math.sin(self.glow_timer * 0.1))
+        # Draw sprite or detailed Halloween candy
+        if False:  # Force fallback shapes for better visuals
+            sprite_rect = self.sprite.get_rect(center=(screen_x, screen_y))
+            screen.blit(self.sprite, sprite_rect)
+        else:
+            # Glow and candy come pre-rendered, one surface per animation frame
+            glow_intensity = _CANDY_GLOW_LUT[int(self.glow_timer * _CANDY_GLOW_STEP) & 255]
+            face_visible = self.type == "normal" and self.glow_timer % 60 < 30  # Blinking effect
+            key = (self.type, self.radius, glow_intensity, face_visible)
+            surface = Candy._sprite_cache.get(key)
+            if surface is None:
+                surface = Candy._sprite_cache[key] = self._render_sprite(*key)
+            offset = self.radius + 3
+            screen.blit(surface, (screen_x - offset, screen_y - offset))
+    
+    @staticmethod
+    def _render_sprite(candy_type: str, radius: int, glow_intensity: int, face_visible: bool) -> pygame.Surface:
+        """Render the glow and candy design for one animation frame"""
         glow_color = ORANGE
-        if self.type == "cursed":
+        if candy_type == "cursed":
             glow_color = RED
-        elif self.type == "bonus":
+        elif candy_type == "bonus":
             glow_color = YELLOW
         
-        glow_radius = self.radius + 3
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*glow_color, glow_intensity), 
+        glow_radius = radius + 3
+        surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*glow_color, glow_intensity), 
                           (glow_radius, glow_radius), glow_radius)
-        screen.blit(glow_surface, (screen_x - glow_radius, screen_y - glow_radius))
         
-        # Draw sprite or detailed Halloween candy
-        if False:  # Force fallback shapes for better visuals
-            sprite_rect = self.sprite.get_rect(center=(screen_x, screen_y))
-            screen.blit(self.sprite, sprite_rect)
+        # Detailed Halloween candy designs, centred on the glow
+        center_x = center_y = glow_radius
+        if candy_type == "cursed":
+            # Cursed candy: dark skull-shaped
+            pygame.draw.circle(surface, (100, 0, 50), (center_x, center_y), radius)
+            pygame.draw.circle(surface, (150, 0, 0), (center_x, center_y), radius - 1)
+            # Skull eyes
+            pygame.draw.circle(surface, BLACK, (center_x - 2, center_y - 1), 1)
+            pygame.draw.circle(surface, BLACK, (center_x + 2, center_y - 1), 1)
+            # Skull mouth
+            pygame.draw.rect(surface, BLACK, (center_x - 1, center_y + 1, 2, 1))
+            
+        elif candy_type == "bonus":
+            # Bonus candy: golden star
+            star_points = []
+            for i in range(10):
+                angle = i * math.pi / 5
+                point_radius = radius if i % 2 == 0 else radius // 2
+                x = center_x + point_radius * math.cos(angle - math.pi / 2)
+                y = center_y + point_radius * math.sin(angle - math.pi / 2)
+                star_points.append((x, y))
+            pygame.draw.polygon(surface, YELLOW, star_points)
+            pygame.draw.polygon(surface, (255, 255, 150), star_points, 1)
+            # Center gem
+            pygame.draw.circle(surface, WHITE, (center_x, center_y), 2)
+            
         else:
-            # Detailed Halloween candy designs
-            if self.type == "cursed":
-                # Cursed candy: dark skull-shaped
-                pygame.draw.circle(screen, (100, 0, 50), (screen_x, screen_y), self.radius)
-                pygame.draw.circle(screen, (150, 0, 0), (screen_x, screen_y), self.radius - 1)
-                # Skull eyes
-                pygame.draw.circle(screen, BLACK, (screen_x - 2, screen_y - 1), 1)
-                pygame.draw.circle(screen, BLACK, (screen_x + 2, screen_y - 1), 1)
-                # Skull mouth
-                pygame.draw.rect(screen, BLACK, (screen_x - 1, screen_y + 1, 2, 1))
-                
-            elif self.type == "bonus":
-                # Bonus candy: golden star
-                star_points = []
-                for i in range(10):
-                    angle = i * math.pi / 5
-                    radius = self.radius if i % 2 == 0 else self.radius // 2
-                    x = screen_x + radius * math.cos(angle - math.pi / 2)
-                    y = screen_y + radius * math.sin(angle - math.pi / 2)
-                    star_points.append((x, y))
-                pygame.draw.polygon(screen, YELLOW, star_points)
-                pygame.draw.polygon(screen, (255, 255, 150), star_points, 1)
-                # Center gem
-                pygame.draw.circle(screen, WHITE, (screen_x, screen_y), 2)
-                
-            else:
-                # Normal candy: pumpkin design
-                pygame.draw.circle(screen, ORANGE, (screen_x, screen_y), self.radius)
-                pygame.draw.circle(screen, (255, 165, 0), (screen_x, screen_y), self.radius - 1)
-                # Pumpkin ridges
-                for i in range(3):
-                    ridge_x = screen_x - 3 + i * 3
-                    pygame.draw.line(screen, (200, 120, 0), 
-                                   (ridge_x, screen_y - self.radius + 2),
-                                   (ridge_x, screen_y + self.radius - 2), 1)
-                # Stem
-                pygame.draw.rect(screen, (0, 100, 0), 
-                               (screen_x - 1, screen_y - self.radius - 2, 2, 3))
-                # Jack-o'-lantern face
-                if self.glow_timer % 60 < 30:  # Blinking effect
-                    pygame.draw.circle(screen, BLACK, (screen_x - 2, screen_y - 1), 1)
-                    pygame.draw.circle(screen, BLACK, (screen_x + 2, screen_y - 1), 1)
-                    # Smile
-                    smile_points = [(screen_x - 2, screen_y + 2), (screen_x, screen_y + 3), (screen_x + 2, screen_y + 2)]
-                    pygame.draw.lines(screen, BLACK, False, smile_points, 1)
+            # Normal candy: pumpkin design
+            pygame.draw.circle(surface, ORANGE, (center_x, center_y), radius)
+            pygame.draw.circle(surface, (255, 165, 0), (center_x, center_y), radius - 1)
+            # Pumpkin ridges
+            for i in range(3):
+                ridge_x = center_x - 3 + i * 3
+                pygame.draw.line(surface, (200, 120, 0), 
+                               (ridge_x, center_y - radius + 2),
+                               (ridge_x, center_y + radius - 2), 1)
+            # Stem
+            pygame.draw.rect(surface, (0, 100, 0), 
+                           (center_x - 1, center_y - radius - 2, 2, 3))
+            # Jack-o'-lantern face
+            if face_visible:
+                pygame.draw.circle(surface, BLACK, (center_x - 2, center_y - 1), 1)
+                pygame.draw.circle(surface, BLACK, (center_x + 2, center_y - 1), 1)
+                # Smile
+                smile_points = [(center_x - 2, center_y + 2), (center_x, center_y + 3), (center_x + 2, center_y + 2)]
+                pygame.draw.lines(surface, BLACK, False, smile_points, 1)
+        
+        return surface
+
+# Tiles that block movement
+SOLID_TILES = frozenset({
+    TileType.WALL, TileType.HOUSE, TileType.CHURCH,
+    TileType.GRAVE, TileType.TREE, TileType.TRASH_CAN
+})
+
+# Tiles that lead somewhere (level completion/transitions)
+DOOR_TILES = frozenset({TileType.DOOR, TileType.CHURCH_DOOR, TileType.CEMETERY_GATE})
+
+# TileType members indexed by their value (0, 1, 2, ... in definition order)
+_TILE_TYPES = tuple(TileType)
+
+# 0/1 flags indexed by tile value, so lookups on self.tiles skip the enum entirely
+_SOLID_BY_VALUE = bytes(int(tile_type in SOLID_TILES) for tile_type in _TILE_TYPES)
+_DOOR_BY_VALUE = bytes(int(tile_type in DOOR_TILES) for tile_type in _TILE_TYPES)
+
+# bytes.translate tables turning a tile row into a 0/1 mask of one tile type
+_TILE_MASKS = tuple(bytes(int(i == tile_type.value) for i in range(256)) for tile_type in _TILE_TYPES)
 
 class TileMap:
     """Manages the tile-based game map"""
     
+    # HOME marker surfaces: glow keyed by alpha, and the label with its background
+    _home_glow_cache = {}
+    _home_label = None
+    
+    # Tile sprites shared by every map, and whether they were made in display format
+    _sprite_cache = None
+    _sprites_converted = False
+    
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.tiles = [[TileType.EMPTY for _ in range(width)] for _ in range(height)]
+        # Tile type values, one byte per tile in row-major order
+        self.tiles = bytearray([TileType.EMPTY.value]) * (width * height)
+        # Same layout, 1 where the tile is solid; kept in sync by set_tile
+        self.solid = bytearray(width * height)
         
         # Load tile sprites with detailed fallbacks
-        self.tile_sprites = {}
-        self._create_tile_sprites()
+        self.tile_sprites = TileMap._shared_sprites()
+        
+        # Whole map pre-rendered into one surface; set_tile only marks it stale, so the
+        # hundreds of set_tile calls while a level is built cost one batched re-bake
+        self._tile_positions = [(x * TILE_SIZE, y * TILE_SIZE) for y in range(height) for x in range(width)]
+        self.map_surface = pygame.Surface((width * TILE_SIZE, height * TILE_SIZE))
+        if pygame.display.get_surface() is not None:
+            # Display format, so the per-frame window blit is a plain copy
+            self.map_surface = self.map_surface.convert()
+        self._map_dirty = True
+        # Source rect of the visible window, updated in place each frame
+        self._view = pygame.Rect(0, 0, 0, 0)
     
-    def _create_tile_sprites(self):
+    def _rebuild_map_surface(self):
+        """Render every tile onto the cached map surface"""
+        # Group tile positions by type; tiles never overlap, so draw order doesn't matter.
+        # Consecutive blits then share a source sprite, which pygame-ce's fblits caches.
+        sprites = self.tile_sprites
+        empty_sprite = sprites[TileType.EMPTY]
+        blit_list = []
+        for value in sorted(set(self.tiles)):
+            # translate() builds the type mask and compress() applies it, both in C
+            mask = self.tiles.translate(_TILE_MASKS[value])
+            sprite = sprites.get(_TILE_TYPES[value], empty_sprite)
+            blit_list.extend(zip(repeat(sprite), compress(self._tile_positions, mask)))
+        
+        # One batched call; fblits only exists on pygame-ce
+        fblits = getattr(self.map_surface, 'fblits', None)
+        if fblits is not None:
+            fblits(blit_list)
+        else:
+            self.map_surface.blits(blit_list, doreturn=False)
+    
+    @classmethod
+    def _shared_sprites(cls) -> dict:
+        """Return the tile sprites, building them on first use"""
+        # Rebuild once a display exists if the first build couldn't convert
+        has_display = pygame.display.get_surface() is not None
+        if cls._sprite_cache is None or (has_display and not cls._sprites_converted):
+            cls._sprite_cache = cls._create_tile_sprites()
+            cls._sprites_converted = has_display
+        return cls._sprite_cache
+    
+    @staticmethod
+    def _create_tile_sprites() -> dict:
         """Create detailed tile sprites with artistic fallbacks"""
+        tile_sprites = {}
         
         # Try loading assets first, create detailed fallbacks if not found
         for tile_type in TileType:
@@ -736,24 +876,25 @@ class TileMap:
             
             # Try to load actual sprite first
             try:
-                if os.path.exists(sprite_path):
+                if asset_exists(sprite_path):
                     sprite = pygame.image.load(sprite_path).convert_alpha()
                     sprite = pygame.transform.scale(sprite, (TILE_SIZE, TILE_SIZE))
-                    self.tile_sprites[tile_type] = sprite
+                    tile_sprites[tile_type] = sprite
                     continue
             except:
                 pass
             
-            # Create detailed fallback sprites
-            sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            # Create detailed fallback sprites (every design fills the whole tile, so no alpha)
+            sprite = pygame.Surface((TILE_SIZE, TILE_SIZE))
             
             if tile_type == TileType.EMPTY:
                 # Grass with small details
                 sprite.fill((0, 80, 0))
+                # A radius-1 circle covers the 2x2 block up-left of its centre; fill() sets it directly
                 for i in range(8):
                     x = random.randint(2, TILE_SIZE - 3)
                     y = random.randint(2, TILE_SIZE - 3)
-                    pygame.draw.circle(sprite, (0, 100, 0), (x, y), 1)
+                    sprite.fill((0, 100, 0), (x - 1, y - 1, 2, 2))
             
             elif tile_type == TileType.STREET:
                 # Asphalt with cracks
@@ -762,7 +903,7 @@ class TileMap:
                 for i in range(3):
                     x = random.randint(5, TILE_SIZE - 5)
                     y = random.randint(5, TILE_SIZE - 5)
-                    pygame.draw.line(sprite, (50, 50, 50), (x-2, y), (x+2, y), 1)
+                    sprite.fill((50, 50, 50), (x - 2, y, 5, 1))  # 5px horizontal crack
             
             elif tile_type == TileType.WALL:
                 # Stone brick wall
@@ -862,85 +1003,128 @@ class TileMap:
                 pygame.draw.circle(sprite, (80, 80, 80), (TILE_SIZE//4, TILE_SIZE//2), 2)
                 pygame.draw.circle(sprite, (80, 80, 80), (3*TILE_SIZE//4, TILE_SIZE//2), 2)
             
-            self.tile_sprites[tile_type] = sprite
+            # Match the display format so blits are plain copies
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()
+            tile_sprites[tile_type] = sprite
+        
+        return tile_sprites
     
     def set_tile(self, x: int, y: int, tile_type: TileType):
         """Set a tile at the given coordinates"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.tiles[y][x] = tile_type
+            index = y * self.width + x
+            self.tiles[index] = tile_type.value
+            self.solid[index] = _SOLID_BY_VALUE[tile_type.value]
+            self._map_dirty = True  # Re-baked on the next draw
     
     def get_tile(self, x: int, y: int) -> TileType:
         """Get the tile type at given coordinates"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x]
+            return _TILE_TYPES[self.tiles[y * self.width + x]]
         return TileType.WALL  # Out of bounds is considered wall
     
     def is_solid_tile(self, x: int, y: int) -> bool:
         """Check if a tile blocks movement"""
-        tile = self.get_tile(x, y)
-        solid_tiles = {
-            TileType.WALL, TileType.HOUSE, TileType.CHURCH, 
-            TileType.GRAVE, TileType.TREE, TileType.TRASH_CAN
-        }
-        return tile in solid_tiles
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.solid[y * self.width + x] == 1
+        return True  # Out of bounds is considered wall
+    
+    def is_solid_rect(self, left: float, top: float, right: float, bottom: float) -> bool:
+        """Check if any tile under the given pixel box blocks movement"""
+        # Each row of tiles under the box is scanned with one C-level find() on the bitmap
+        solid = self.solid
+        width = self.width
+        tile_size = TILE_SIZE
+        tile_left = int(left // tile_size)
+        tile_right = int(right // tile_size)
+        if tile_left < 0 or tile_right >= width:
+            return True  # Out of bounds is considered wall
+        for tile_y in range(int(top // tile_size), int(bottom // tile_size) + 1):
+            if not 0 <= tile_y < self.height:
+                return True  # Out of bounds is considered wall
+            row = tile_y * width
+            if solid.find(1, row + tile_left, row + tile_right + 1) >= 0:
+                return True
+        return False
     
     def is_door_tile(self, x: int, y: int) -> bool:
         """Check if a tile is a door (for level completion/transitions)"""
-        tile = self.get_tile(x, y)
-        return tile in {TileType.DOOR, TileType.CHURCH_DOOR, TileType.CEMETERY_GATE}
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return _DOOR_BY_VALUE[self.tiles[y * self.width + x]] == 1
+        return False  # Out of bounds is wall, not a door
     
     def draw(self, screen: pygame.Surface, highlight_house: bool = False, house_pos: Tuple[int, int] = None):
         """Draw the visible portion of the tile map"""
-        # Calculate visible tile range
-        start_x = max(0, int(camera.x // TILE_SIZE) - 1)
-        end_x = min(self.width, int((camera.x + screen.get_width()) // TILE_SIZE) + 2)
-        start_y = max(0, int(camera.y // TILE_SIZE) - 1)
-        end_y = min(self.height, int((camera.y + screen.get_height()) // TILE_SIZE) + 2)
-        
-        # Draw visible tiles
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile_type = self.tiles[y][x]
-                sprite = self.tile_sprites.get(tile_type, self.tile_sprites[TileType.EMPTY])
-                
-                screen_x = x * TILE_SIZE - camera.x
-                screen_y = y * TILE_SIZE - camera.y
-                
-                screen.blit(sprite, (screen_x, screen_y))
-                
-                # Add special highlighting for house destination
-                if highlight_house and house_pos and x == house_pos[0] // TILE_SIZE and y == house_pos[1] // TILE_SIZE:
-                    # Draw glowing destination marker
-                    time_factor = pygame.time.get_ticks() * 0.005
-                    glow_intensity = int(100 + 50 * math.sin(time_factor))
-                    
-                    # Pulsing glow around house
-                    glow_surface = pygame.Surface((TILE_SIZE + 20, TILE_SIZE + 20), pygame.SRCALPHA)
-                    pygame.draw.rect(glow_surface, (255, 255, 0, glow_intensity), 
-                                   (0, 0, TILE_SIZE + 20, TILE_SIZE + 20), border_radius=10)
-                    screen.blit(glow_surface, (screen_x - 10, screen_y - 10))
-                    
-                    # "HOME" text above house
-                    font = asset_manager.load_font("assets/fonts/creepy.ttf", 16)
-                    home_text = font.render("HOME", True, YELLOW)
-                    text_rect = home_text.get_rect(center=(screen_x + TILE_SIZE//2, screen_y - 10))
-                    
-                    # Text background
-                    bg_rect = pygame.Rect(text_rect.x - 5, text_rect.y - 2, text_rect.width + 10, text_rect.height + 4)
-                    pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect, border_radius=5)
-                    
-                    screen.blit(home_text, text_rect)
+        if self._map_dirty:
+            self._rebuild_map_surface()
+            self._map_dirty = False
+        
+        # Copy the visible window of the pre-rendered map in one blit
+        view = self._view
+        view.update(int(camera.x), int(camera.y), *screen.get_size())
+        if not view.colliderect(self.map_surface.get_rect()):
+            return  # Map entirely off-screen, and the house with it
+        screen.blit(self.map_surface, (0, 0), view)
+        
+        # Add special highlighting for house destination
+        if highlight_house and house_pos:
+            screen_x = int(house_pos[0] // TILE_SIZE) * TILE_SIZE - camera.x
+            screen_y = int(house_pos[1] // TILE_SIZE) * TILE_SIZE - camera.y
+            
+            # Draw glowing destination marker
+            time_factor = pygame.time.get_ticks() * 0.005
+            glow_intensity = int(100 + 50 * math.sin(time_factor))
+            
+            # Pulsing glow around house
+            glow_surface = TileMap._home_glow_cache.get(glow_intensity)
+            if glow_surface is None:
+                glow_surface = pygame.Surface((TILE_SIZE + 20, TILE_SIZE + 20), pygame.SRCALPHA)
+                pygame.draw.rect(glow_surface, (255, 255, 0, glow_intensity), 
+                               (0, 0, TILE_SIZE + 20, TILE_SIZE + 20), border_radius=10)
+                TileMap._home_glow_cache[glow_intensity] = glow_surface
+            screen.blit(glow_surface, (screen_x - 10, screen_y - 10))
+            
+            # "HOME" text above house, rendered once together with its background
+            if TileMap._home_label is None:
+                TileMap._home_label = self._render_home_label()
+            label_rect = TileMap._home_label.get_rect(center=(screen_x + TILE_SIZE//2, screen_y - 10))
+            screen.blit(TileMap._home_label, label_rect)
+    
+    @staticmethod
+    def _render_home_label() -> pygame.Surface:
+        """Render the HOME text on its rounded black background"""
+        font = asset_manager.load_font("assets/fonts/creepy.ttf", 16)
+        home_text = font.render("HOME", True, YELLOW)
+        label = pygame.Surface((home_text.get_width() + 10, home_text.get_height() + 4), pygame.SRCALPHA)
+        pygame.draw.rect(label, BLACK, label.get_rect(), border_radius=5)
+        label.blit(home_text, (5, 2))
+        return label
 
 class EasterEgg:
     """Hidden collectible with special rewards"""
     
+    __slots__ = (
+        'x', 'y', 'type', 'reward', '_reward_key', 'activated',
+        'interaction_radius', '_radius_sq', 'visible', 'glow_timer', 'rect'
+    )
+    
+    # Reach for interact(); also the radius of the level's egg grid queries
+    INTERACTION_RADIUS = 20
+    
+    # Glow + egg sprites for 16 glow phases, shared by all eggs; built on first draw
+    _glow_cache = None
+    
     def __init__(self, x: float, y: float, egg_type: str, reward: str):
         self.x = x
         self.y = y
         self.type = egg_type  # "stash", "puzzle", "dig", "secret"
         self.reward = reward  # Description of reward
+        reward_text = reward.lower()
+        self._reward_key = next((key for key in _EGG_REWARD_TABLE if key in reward_text), None)
         self.activated = False
-        self.interaction_radius = 20
+        self.interaction_radius = EasterEgg.INTERACTION_RADIUS
+        self._radius_sq = self.interaction_radius * self.interaction_radius
         
         # Visual properties
         self.visible = egg_type != "secret"  # Secret eggs are invisible until found
@@ -960,8 +1144,9 @@ class EasterEgg:
         if self.activated:
             return False, "Already found!", []
         
-        distance = math.sqrt((self.x - player.x) ** 2 + (self.y - player.y) ** 2)
-        if distance > self.interaction_radius:
+        dx = self.x - player.x
+        dy = self.y - player.y
+        if dx * dx + dy * dy > self._radius_sq:
             return False, "Get closer!", []
         
         self.activated = True
@@ -970,23 +1155,13 @@ class EasterEgg:
         # Apply reward
         message = f"Found Easter egg: {self.reward}!"
         
-        if "health" in self.reward.lower():
+        key = self._reward_key
+        powerup = _EGG_REWARD_TABLE.get(key)
+        if powerup is not None:
+            player.add_powerup(*powerup)
+        elif key == "health":
             player.heal(1)
-        elif "magnet" in self.reward.lower():
-            player.add_powerup(PowerUpType.CANDY_MAGNET, 600)  # 10 seconds
-        elif "repel" in self.reward.lower():
-            player.add_powerup(PowerUpType.GHOST_REPEL, 900)  # 15 seconds
-        elif "speed" in self.reward.lower():
-            player.add_powerup(PowerUpType.SPEED_BOOST, 420)  # 7 seconds
-        elif "invisibility" in self.reward.lower():
-            player.add_powerup(PowerUpType.INVISIBILITY, 720)  # 12 seconds
-        elif "time slow" in self.reward.lower():
-            player.add_powerup(PowerUpType.TIME_SLOW, 480)  # 8 seconds
-        elif "double points" in self.reward.lower():
-            player.add_powerup(PowerUpType.DOUBLE_POINTS, 600)  # 10 seconds
-        elif "shield" in self.reward.lower():
-            player.add_powerup(PowerUpType.SHIELD, 900)  # 15 seconds
-        elif "points" in self.reward.lower():
+        elif key == "points":
             player.score += 25
         
         # Create celebration particles
@@ -996,7 +1171,7 @@ class EasterEgg:
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
             color = random.choice([YELLOW, ORANGE, RED, GREEN])
-            particles.append(Particle(self.x, self.y, vx, vy, color, 60))
+            particles.append(particle_pool.acquire(self.x, self.y, vx, vy, color, 60))
         
         return True, message, particles
     
@@ -1008,12 +1183,88 @@ class EasterEgg:
         screen_x = int(self.x - camera.x)
         screen_y = int(self.y - camera.y)
         
-        # Draw glowing effect
-        glow_intensity = int(80 + 40 * math.sin(self.glow_timer * 0.15))
-        glow_surface = pygame.Surface((30, 30), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*PURPLE, glow_intensity), (15, 15), 12)
-        screen.blit(glow_surface, (screen_x - 15, screen_y - 15))
-        
-        # Draw egg shape
-        pygame.draw.ellipse(screen, PURPLE, (screen_x - 8, screen_y - 10, 16, 20))
-        pygame.draw.ellipse(screen, YELLOW, (screen_x - 6, screen_y - 8, 12, 16))
\ No newline at end of file
+        # Glowing egg, pre-composited per glow phase
+        frames = EasterEgg._glow_cache
+        if frames is None:
+            frames = EasterEgg._build_glow_cache()
+        frame = frames[int(self.glow_timer * _EGG_GLOW_STEP) & 15]
+        screen.blit(frame, (screen_x - 15, screen_y - 15))
+    
+    @classmethod
+    def _build_glow_cache(cls):
+        """Render the glow and egg shape for each of the 16 glow phases"""
+        frames = []
+        for i in range(16):
+            glow_intensity = int(80 + 40 * math.sin(i * _TWO_PI / 16))
+            surface = pygame.Surface((30, 30), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (*PURPLE, glow_intensity), (15, 15), 12)
+            # Egg shape on top of the glow
+            pygame.draw.ellipse(surface, PURPLE, (7, 5, 16, 20))
+            pygame.draw.ellipse(surface, YELLOW, (9, 7, 12, 16))
+            frames.append(surface)
+        cls._glow_cache = frames
+        return frames
+
+class SpatialHash:
+    """Uniform grid that buckets entities by position for neighbourhood queries"""
+    
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        # Each cell holds parallel lists (xs, ys, entities), so distance tests
+        # read the stored positions instead of each entity's attributes
+        self.cells = {}
+    
+    def insert(self, entity, x: float, y: float):
+        """Add an entity at the given world position"""
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            bucket = self.cells[key] = ([], [], [])
+        bucket[0].append(x)
+        bucket[1].append(y)
+        bucket[2].append(entity)
+    
+    def remove(self, entity, x: float, y: float):
+        """Drop an entity inserted at the given world position"""
+        key = (int(x // self.cell_size), int(y // self.cell_size))
+        bucket = self.cells.get(key)
+        if bucket is None:
+            return
+        entities = bucket[2]
+        for index, other in enumerate(entities):
+            if other is entity:
+                del bucket[0][index], bucket[1][index], entities[index]
+                break
+        if not entities:
+            del self.cells[key]
+    
+    def _buckets(self, x: float, y: float, radius: float):
+        """Yield the non-empty cells overlapping the square around (x, y)"""
+        cell_size = self.cell_size
+        cells = self.cells
+        min_x = int((x - radius) // cell_size)
+        max_x = int((x + radius) // cell_size)
+        for cell_y in range(int((y - radius) // cell_size), int((y + radius) // cell_size) + 1):
+            for cell_x in range(min_x, max_x + 1):
+                bucket = cells.get((cell_x, cell_y))
+                if bucket:
+                    yield bucket
+    
+    def query(self, x: float, y: float, radius: float) -> list:
+        """Return the entities in every cell overlapping the square around (x, y)"""
+        found = []
+        for bucket in self._buckets(x, y, radius):
+            found.extend(bucket[2])
+        return found
+    
+    def query_radius(self, x: float, y: float, radius: float) -> list:
+        """Return the entities stored within radius of (x, y)"""
+        radius_sq = radius * radius
+        found = []
+        for xs, ys, entities in self._buckets(x, y, radius):
+            for entity_x, entity_y, entity in zip(xs, ys, entities):
+                dx = entity_x - x
+                dy = entity_y - y
+                if dx * dx + dy * dy <= radius_sq:
+                    found.append(entity)
+        return found
\ No newline at end of file
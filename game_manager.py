@@ -5,11 +5,11 @@ Coordinates all game systems and manages game states
 
 import pygame
 import random
-import math
 from typing import List, Optional, Tuple
 from halloween_haunt import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FPS, CANDIES_TO_COLLECT,
-    TILE_SIZE, TileType, GameState, Particle, camera, save_manager
+    TILE_SIZE, TileType, GameState, Particle, PowerUpType, camera, save_manager, particle_pool,
+    step_particles, MAX_PARTICLES
 )
 from entities import Player, Ghost, Candy, EasterEgg
 from levels import Level, LevelManager, CemeteryArea
@@ -18,6 +18,18 @@ from ui import (MainMenu, PauseMenu, HUD, TutorialOverlay,
 from sound import SoundManager
 from special_features import SpecialFeaturesManager
 
+# Squared distances for the proximity checks, so they can skip the sqrt
+NIGHT_GHOST_MIN_DIST_SQ = 160 * 160  # 5 tiles from the player
+HOUSE_REACH_SQ = (TILE_SIZE * 1.5) ** 2
+
+# TILE_SIZE is a power of two, so pixel -> tile for the (non-negative) player position is a shift
+TILE_SHIFT = TILE_SIZE.bit_length() - 1
+
+# Player.active_powerup_mask bits for the power-ups checked every frame
+CANDY_MAGNET_BIT = 1 << PowerUpType.CANDY_MAGNET.value
+GHOST_REPEL_BIT = 1 << PowerUpType.GHOST_REPEL.value
+ZOMBIE_POWER_BIT = 1 << PowerUpType.ZOMBIE_POWER.value
+
 class GameManager:
     """Main game manager that coordinates all systems"""
     
@@ -37,6 +49,7 @@ class GameManager:
         # Game entities
         self.player: Optional[Player] = None
         self.current_level: Optional[Level] = None
+        self._house_pos: Tuple[float, float] = (0.0, 0.0)  # Cached by _set_current_level
         self.cemetery_area: Optional[CemeteryArea] = None
         
         # UI systems
@@ -52,6 +65,7 @@ class GameManager:
         self.particles: List[Particle] = []
         self.screen_shake_timer = 0
         self.screen_shake_intensity = 0
+        self._paused_background: Optional[pygame.Surface] = None  # Game frame frozen behind the pause menu
         
         # Game mechanics
         self.night_mode_timer = 0
@@ -60,17 +74,53 @@ class GameManager:
         self.message_timer = 0
         self.day_night_cycle_duration = 10800  # 3 minutes at 60 FPS
         
+        # One-shot prompt flags for the cemetery gate and exit
+        self._cemetery_prompt_shown = False
+        self._cemetery_entered = False
+        self._exit_message_shown = False
+        
         # Input handling
         self.keys_pressed = pygame.key.get_pressed()
+        self._k_space = False  # Per-frame snapshots of the keys checked in several places
+        self._k_return = False
+        self._space_pressed = False  # SPACE went down this frame (edge, not level)
+        self._last_space_state = False
         self.mouse_pos = pygame.mouse.get_pos()
         self.mouse_clicked = False
+        self.dt = 1.0 / FPS  # Seconds since the previous frame
         
         # Display settings
         self.fullscreen = False
         
+        # Per-state update/draw handlers, so each frame does one dict lookup
+        self._build_state_dispatch()
+        
         # Load saved progress
         self._load_saved_progress()
     
+    def _build_state_dispatch(self):
+        """Map each game state to its update and draw handlers"""
+        self._update_dispatch = {
+            GameState.MAIN_MENU: self._update_main_menu,
+            GameState.TUTORIAL: self._update_tutorial,
+            GameState.PLAYING: self._update_gameplay,
+            GameState.CEMETERY: self._update_cemetery,
+            GameState.PAUSED: lambda: self.pause_menu.update(self.mouse_pos, self.mouse_clicked),
+            GameState.GAME_OVER: lambda: self.game_over_screen.update(self.mouse_pos, self.mouse_clicked),
+            GameState.VICTORY: lambda: self.victory_screen.update(self.mouse_pos, self.mouse_clicked),
+            GameState.SETTINGS: lambda: self.settings_menu.update(self.mouse_pos, self.mouse_clicked),
+        }
+        self._draw_dispatch = {
+            GameState.MAIN_MENU: lambda: self.main_menu.draw(self.screen),
+            GameState.PLAYING: self._draw_gameplay,
+            GameState.TUTORIAL: self._draw_tutorial,
+            GameState.CEMETERY: lambda: self._draw_cemetery(),
+            GameState.PAUSED: self._draw_paused,
+            GameState.GAME_OVER: lambda: self.game_over_screen.draw(self.screen, self._final_score()),
+            GameState.VICTORY: lambda: self.victory_screen.draw(self.screen, self._final_score()),
+            GameState.SETTINGS: lambda: self.settings_menu.draw(self.screen),
+        }
+    
     def _load_saved_progress(self):
         """Load saved game progress"""
         save_data = save_manager.load_progress()
@@ -117,38 +167,38 @@ class GameManager:
     
     def _handle_player_interactions(self):
         """Handle player interactions with game objects"""
+        player_x, player_y = self.player.x, self.player.y
+        
         # Check candy collection
-        for candy in self.current_level.candies:
-            if not candy.collected:
-                distance = math.sqrt(
-                    (self.player.x - candy.x) ** 2 + (self.player.y - candy.y) ** 2
-                )
-                if distance <= 25:  # Collection radius
-                    particles = candy.collect(self.player)
-                    self.particles.extend(particles)
-                    # Play your custom collect sound
-                    self.sound_manager.play_collect_sound()
-                    
-                    # Check if we have enough candies
-                    if self.player.candies_collected >= CANDIES_TO_COLLECT:
-                        self.show_message("Return to house to complete the level!")
+        for _ in range(self._collect_candies_within(25)):
+            # Play your custom collect sound
+            self.sound_manager.play_collect_sound()
+            
+            # Check if we have enough candies
+            if self.player.candies_collected >= CANDIES_TO_COLLECT:
+                self.show_message("Return to house to complete the level!")
         
         # Check cemetery gate interaction
-        player_tile_x = int(self.player.x // TILE_SIZE)
-        player_tile_y = int(self.player.y // TILE_SIZE)
-        if self.current_level.tile_map.get_tile(player_tile_x, player_tile_y) == TileType.CEMETERY_GATE:
-            if not hasattr(self, '_cemetery_entered'):
+        player_tile_x = int(player_x) >> TILE_SHIFT
+        player_tile_y = int(player_y) >> TILE_SHIFT
+        if self.current_level.tile_map.get_tile(player_tile_x, player_tile_y) is TileType.CEMETERY_GATE:
+            if not self._cemetery_prompt_shown:
                 self.show_message("Press SPACE to enter the cemetery...")
-                self._cemetery_entered = False
-            if self.keys_pressed[pygame.K_SPACE] and not self._cemetery_entered:
-                self._enter_cemetery(self.player.x, self.player.y)
+                self._cemetery_prompt_shown = True
+            if self._k_space and not self._cemetery_entered:
+                self._enter_cemetery(player_x, player_y)
                 self._cemetery_entered = True
-        elif hasattr(self, '_cemetery_entered'):
+                player_x, player_y = self.player.x, self.player.y  # Entering may move the player
+        elif self._cemetery_prompt_shown:
             # Reset when leaving cemetery area
-            delattr(self, '_cemetery_entered')
+            self._cemetery_prompt_shown = False
+            self._cemetery_entered = False
         
-        # Check Easter egg interactions
-        for egg in self.current_level.easter_eggs:
+        # Check Easter egg interactions, only for eggs within reach
+        nearby_eggs = self.current_level.egg_grid.query_radius(
+            player_x, player_y, EasterEgg.INTERACTION_RADIUS
+        )
+        for egg in nearby_eggs:
             if not egg.activated:
                 success, message, particles = egg.interact(self.player)
                 if success:
@@ -164,51 +214,47 @@ class GameManager:
     
     def update(self, dt: float):
         """Update game state"""
+        self.dt = dt
+        
         # Update input state at the beginning of each frame
-        self.keys_pressed = pygame.key.get_pressed()
+        keys_pressed = self.keys_pressed = pygame.key.get_pressed()
+        self._k_space = keys_pressed[pygame.K_SPACE]
+        self._k_return = keys_pressed[pygame.K_RETURN]
         self.mouse_pos = pygame.mouse.get_pos()
         
-        # Update based on current state
-        if self.current_state == GameState.MAIN_MENU:
-            # Quick start with ENTER key for testing
-            if self.keys_pressed[pygame.K_RETURN]:
-                self.start_new_game()
-                return
-            self.main_menu.update(self.mouse_pos, self.mouse_clicked)
-        
-        elif self.current_state == GameState.TUTORIAL:
-            if self.tutorial.update(self.mouse_pos, self.mouse_clicked):
-                self._transition_to_gameplay()
-            else:
-                self._update_gameplay_entities()
-        
-        elif self.current_state == GameState.PLAYING:
-            self._update_gameplay()
-        
-        elif self.current_state == GameState.CEMETERY:
-            self._update_cemetery()
-        
-        elif self.current_state == GameState.PAUSED:
-            self.pause_menu.update(self.mouse_pos, self.mouse_clicked)
-        
-        elif self.current_state == GameState.GAME_OVER:
-            self.game_over_screen.update(self.mouse_pos, self.mouse_clicked)
-        
-        elif self.current_state == GameState.VICTORY:
-            self.victory_screen.update(self.mouse_pos, self.mouse_clicked)
-        
-        elif self.current_state == GameState.SETTINGS:
-            self.settings_menu.update(self.mouse_pos, self.mouse_clicked)
+        # Update based on current state; a handler returns True to end the frame early
+        handler = self._update_dispatch.get(self.current_state)
+        if handler is not None and handler():
+            return
         
-        # Update visual effects
-        self._update_particles()
-        self._update_screen_shake()
-        self._update_message_timer()
+        # Update visual effects, skipping the calls when there is nothing running
+        if self.particles:
+            self._update_particles()
+        if self.screen_shake_timer > 0:
+            self._update_screen_shake()
+        if self.message_timer > 0:
+            self._update_message_timer()
         
         # Reset mouse click state
         if self.mouse_clicked:
             self.mouse_clicked = False
     
+    def _update_main_menu(self) -> bool:
+        """Update the main menu; returns True if a new game was started"""
+        # Quick start with ENTER key for testing
+        if self._k_return:
+            self.start_new_game()
+            return True
+        self.main_menu.update(self.mouse_pos, self.mouse_clicked)
+        return False
+    
+    def _update_tutorial(self):
+        """Update the tutorial overlay and the game running behind it"""
+        if self.tutorial.update(self.mouse_pos, self.mouse_clicked):
+            self._transition_to_gameplay()
+        else:
+            self._update_gameplay_entities()
+    
     def _update_gameplay(self):
         """Update gameplay-specific logic"""
         if not self.player or not self.current_level:
@@ -236,25 +282,21 @@ class GameManager:
         
         # Update special features
         special_particles, special_message = self.special_features.update(
-            self.player, self.keys_pressed, 
-            getattr(self, '_space_pressed', False)
+            self.player, self.keys_pressed, self._space_pressed
         )
         self.particles.extend(special_particles)
         if special_message:
             self.show_message(special_message)
         
         # Update camera to follow player
-        camera.update(self.player.x, self.player.y)
+        camera.update(self.player.x, self.player.y, self.dt)
         
         # Apply candy magnet power-up
-        for powerup in self.player.active_powerups:
-            if powerup.type.name == "CANDY_MAGNET":
-                self._apply_candy_magnet()
+        if self.player.active_powerup_mask & CANDY_MAGNET_BIT:
+            self._apply_candy_magnet()
         
         # Store space state for next frame
-        if not hasattr(self, '_last_space_state'):
-            self._last_space_state = False
-        current_space = self.keys_pressed[pygame.K_SPACE]
+        current_space = self._k_space
         self._space_pressed = current_space and not self._last_space_state
         self._last_space_state = current_space
     
@@ -262,38 +304,45 @@ class GameManager:
         """Apply candy magnet effect"""
         magnet_radius = 50
         
-        for candy in self.current_level.candies:
+        # Auto-collect candy
+        for _ in range(self._collect_candies_within(magnet_radius)):
+            # Play collect sound (quieter for auto-collect)
+            self.sound_manager.play_sound("collect", 0.5)
+    
+    def _collect_candies_within(self, radius: float) -> int:
+        """Collect every candy within radius of the player and return how many"""
+        # Shared by pickup and magnet: one grid pass does the distance test on
+        # stored positions, and collected candies leave the grid
+        candy_grid = self.current_level.candy_grid
+        player = self.player
+        particles = self.particles
+        collected = 0
+        for candy in candy_grid.query_radius(player.x, player.y, radius):
             if not candy.collected:
-                distance = math.sqrt(
-                    (self.player.x - candy.x) ** 2 + (self.player.y - candy.y) ** 2
-                )
-                
-                if distance <= magnet_radius:
-                    # Auto-collect candy
-                    particles = candy.collect(self.player)
-                    self.particles.extend(particles)
-                    # Play collect sound (quieter for auto-collect)
-                    self.sound_manager.play_sound("collect", 0.5)
+                candy_grid.remove(candy, candy.x, candy.y)
+                candy.collect(player, particles)  # Particles go straight into the live list
+                collected += 1
+        return collected
     
     def _check_collisions(self):
         """Check for collisions between entities"""
         if not self.player or not self.current_level:
             return
+        player = self.player
         
-        # Check ghost collisions
-        for ghost in self.current_level.ghosts:
-            if self.player.rect.colliderect(ghost.rect):
-                # Check if player has ghost repel power-up
-                has_repel = any(p.type.name == "GHOST_REPEL" for p in self.player.active_powerups)
+        # Check ghost collisions (all ghost rects are tested in one collidelistall call)
+        for _ in player.rect.collidelistall(self.current_level.get_ghost_rects()):
+            # Check if player has ghost repel power-up
+            has_repel = player.active_powerup_mask & GHOST_REPEL_BIT
+            
+            if not has_repel and player.take_damage():
+                # Play your custom hit sound
+                self.sound_manager.play_hit_sound()
+                self._trigger_screen_shake(10, 5)
                 
-                if not has_repel and self.player.take_damage():
-                    # Play your custom hit sound
-                    self.sound_manager.play_hit_sound()
-                    self._trigger_screen_shake(10, 5)
-                    
-                    # Check for game over
-                    if self.player.health <= 0:
-                        self._game_over()
+                # Check for game over
+                if player.health <= 0:
+                    self._game_over()
     
     def _update_day_night_cycle(self):
         """Update day/night cycle"""
@@ -320,70 +369,65 @@ class GameManager:
         if not self.current_level:
             return
         
+        randint = random.randint
+        is_solid_tile = self.current_level.tile_map.is_solid_tile
+        player_x, player_y = self.player.x, self.player.y
+        
         # Add 2 more ghosts
         for _ in range(2):
-            attempts = 0
-            while attempts < 50:
-                x = random.randint(2, 28) * 32 + 16
-                y = random.randint(2, 18) * 32 + 16
-                
-                # Check if position is valid and away from player
-                tile_x, tile_y = int(x // 32), int(y // 32)
-                distance_to_player = math.sqrt(
-                    (x - self.player.x) ** 2 + (y - self.player.y) ** 2
-                )
+            for _ in range(50):  # Up to 50 attempts per ghost
+                tile_x, tile_y = randint(2, 28), randint(2, 18)
+                x = tile_x * 32 + 16
+                y = tile_y * 32 + 16
                 
-                if (not self.current_level.tile_map.is_solid_tile(tile_x, tile_y) and
-                    distance_to_player > 160):  # 5 tiles away
-                    
+                # Away from player first (pure arithmetic), then check the tile is open
+                dx = x - player_x
+                dy = y - player_y
+                if dx * dx + dy * dy > NIGHT_GHOST_MIN_DIST_SQ and not is_solid_tile(tile_x, tile_y):
                     patrol_route = [(x, y), (x + 64, y), (x, y + 64), (x - 64, y)]
                     night_ghost = Ghost(x, y, patrol_route)
                     self.current_level.ghosts.append(night_ghost)
                     break
-                
-                attempts += 1
     
     def _update_cemetery(self):
         """Update cemetery-specific logic"""
         if not self.player or not self.cemetery_area:
             return
+        player = self.player
         
         # Update player movement in cemetery
-        self.player.update(self.keys_pressed, self.cemetery_area.tile_map)
+        player.update(self.keys_pressed, self.cemetery_area.tile_map)
         
         # Update cemetery entities
-        chase_events = self.cemetery_area.update(self.player)
+        chase_events = self.cemetery_area.update(player)
         
         # Play ghost sound when chasing starts
         if chase_events:
             self.sound_manager.play_ghost_sound()
         
         # Check collisions with cemetery ghosts
-        for ghost in self.cemetery_area.ghosts:
-            if self.player.rect.colliderect(ghost.rect):
-                has_repel = any(p.type.name == "GHOST_REPEL" for p in self.player.active_powerups)
-                has_zombie = any(p.type.name == "ZOMBIE_POWER" for p in self.player.active_powerups)
+        for _ in player.rect.collidelistall(self.cemetery_area.get_ghost_rects()):
+            # One mask test covers both repel and zombie power
+            if not player.active_powerup_mask & (GHOST_REPEL_BIT | ZOMBIE_POWER_BIT) and player.take_damage():
+                self.sound_manager.play_hit_sound()
+                self._trigger_screen_shake(10, 5)
                 
-                if not has_repel and not has_zombie and self.player.take_damage():
-                    self.sound_manager.play_hit_sound()
-                    self._trigger_screen_shake(10, 5)
-                    
-                    # Check for game over
-                    if self.player.health <= 0:
-                        self._game_over()
+                # Check for game over
+                if player.health <= 0:
+                    self._game_over()
         
         # Check if player wants to exit cemetery
-        if self.cemetery_area.check_exit(self.player.x, self.player.y):
-            if not hasattr(self, '_exit_message_shown'):
+        if self.cemetery_area.check_exit(player.x, player.y):
+            if not self._exit_message_shown:
                 self.show_message("Press SPACE to exit the cemetery")
                 self._exit_message_shown = True
-            if self.keys_pressed[pygame.K_SPACE]:
+            if self._k_space:
                 self._exit_cemetery()
-        elif hasattr(self, '_exit_message_shown'):
-            delattr(self, '_exit_message_shown')
+        elif self._exit_message_shown:
+            self._exit_message_shown = False
         
         # Update camera
-        camera.update(self.player.x, self.player.y)
+        camera.update(player.x, player.y, self.dt)
     
     def _complete_level(self):
         """Handle level completion"""
@@ -413,7 +457,7 @@ class GameManager:
         """Advance to the next level"""
         next_level = self.level_manager.next_level()
         if next_level:
-            self.current_level = next_level
+            self._set_current_level(next_level)
             
             # Setup special features for new level
             self._setup_special_features()
@@ -456,9 +500,16 @@ class GameManager:
     
     def _update_particles(self):
         """Update particle effects"""
-        self.particles = [p for p in self.particles if p.lifetime > 0]
-        for particle in self.particles:
-            particle.update()
+        particles = self.particles
+        step_particles(particles, particle_pool)
+        
+        # Bound effect spikes: retire the oldest particles back to the pool
+        excess = len(particles) - MAX_PARTICLES
+        if excess > 0:
+            release = particle_pool.release
+            for particle in particles[:excess]:
+                release(particle)
+            del particles[:excess]
     
     def _update_screen_shake(self):
         """Update screen shake effect"""
@@ -493,43 +544,32 @@ class GameManager:
     
     def draw(self):
         """Draw the current game state"""
-        # Calculate screen shake offset
-        shake_x = 0
-        shake_y = 0
-        if self.screen_shake_timer > 0:
-            shake_x = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
-            shake_y = random.randint(-self.screen_shake_intensity, self.screen_shake_intensity)
-        
         # Clear screen
         self.screen.fill((20, 20, 40))  # Dark blue-gray background
         
         # Draw based on current state
-        if self.current_state == GameState.MAIN_MENU:
-            self.main_menu.draw(self.screen)
-        
-        elif self.current_state in [GameState.PLAYING, GameState.TUTORIAL]:
+        handler = self._draw_dispatch.get(self.current_state)
+        if handler is not None:
+            handler()
+    
+    def _draw_tutorial(self):
+        """Draw the game with the tutorial overlay on top"""
+        self._draw_gameplay()
+        self.tutorial.draw(self.screen)
+    
+    def _draw_paused(self):
+        """Draw the game behind the pause menu"""
+        # Nothing in the world moves while paused, so it is rendered once and reused
+        if self._paused_background is None:
             self._draw_gameplay()
-            
-            if self.current_state == GameState.TUTORIAL:
-                self.tutorial.draw(self.screen)
-        
-        elif self.current_state == GameState.CEMETERY:
-            self._draw_cemetery()
-        
-        elif self.current_state == GameState.PAUSED:
-            self._draw_gameplay()  # Draw game behind pause menu
-            self.pause_menu.draw(self.screen)
-        
-        elif self.current_state == GameState.GAME_OVER:
-            score = self.player.score if self.player else 0
-            self.game_over_screen.draw(self.screen, score)
-        
-        elif self.current_state == GameState.VICTORY:
-            score = self.player.score if self.player else 0
-            self.victory_screen.draw(self.screen, score)
-        
-        elif self.current_state == GameState.SETTINGS:
-            self.settings_menu.draw(self.screen)
+            self._paused_background = self.screen.copy()
+        else:
+            self.screen.blit(self._paused_background, (0, 0))
+        self.pause_menu.draw(self.screen)
+    
+    def _final_score(self) -> int:
+        """Score shown on the game over and victory screens"""
+        return self.player.score if self.player else 0
     
     def _draw_gameplay(self):
         """Draw gameplay elements"""
@@ -557,7 +597,7 @@ class GameManager:
         self.player = Player(0, 0)  # Position will be set by level
         
         # Load first level
-        self.current_level = self.level_manager.load_level(1)
+        self._set_current_level(self.level_manager.load_level(1))
         spawn_x, spawn_y = self.current_level.get_spawn_position()
         self.player.x = spawn_x
         self.player.y = spawn_y
@@ -591,7 +631,7 @@ class GameManager:
         self.player.score = save_data.get("score", 0)
         
         # Load saved level
-        self.current_level = self.level_manager.load_level(level_number)
+        self._set_current_level(self.level_manager.load_level(level_number))
         spawn_x, spawn_y = self.current_level.get_spawn_position()
         self.player.x = spawn_x
         self.player.y = spawn_y
@@ -609,17 +649,19 @@ class GameManager:
         if self.current_state == GameState.PLAYING:
             self.previous_state = self.current_state
             self.current_state = GameState.PAUSED
+            self._paused_background = None  # Re-captured on the first paused frame
     
     def resume_game(self):
         """Resume the game"""
         if self.current_state == GameState.PAUSED:
             self.current_state = self.previous_state
+            self._paused_background = None
     
     def restart_level(self):
         """Restart the current level"""
         if self.current_level:
             # Reload current level
-            self.current_level = self.level_manager.restart_current_level()
+            self._set_current_level(self.level_manager.restart_current_level())
             
             # Setup special features for restarted level
             self._setup_special_features()
@@ -682,16 +724,22 @@ class GameManager:
         if not self.player or not self.current_level:
             return
         
+        # Cheap count gate first; the house position is cached at level load
         if self.player.candies_collected >= CANDIES_TO_COLLECT:
             # Check if player is near the house
-            house_x, house_y = self.current_level.get_house_position()
-            distance_to_house = math.sqrt(
-                (self.player.x - house_x) ** 2 + (self.player.y - house_y) ** 2
-            )
+            house_x, house_y = self._house_pos
+            dx = self.player.x - house_x
+            dy = self.player.y - house_y
             
-            if distance_to_house <= TILE_SIZE * 1.5:
+            if dx * dx + dy * dy <= HOUSE_REACH_SQ:
                 self._complete_level()
     
+    def _set_current_level(self, level: Optional[Level]):
+        """Switch to a level and cache its house position for the completion check"""
+        self.current_level = level
+        if level is not None:
+            self._house_pos = level.get_house_position()
+    
     def _setup_special_features(self):
         """Setup special features for the current level"""
         # This method can be expanded to setup level-specific special features
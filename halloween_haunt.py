@@ -27,6 +27,7 @@ import os
 import json
 import math
 import random
+import functools
 from enum import Enum
 from typing import List, Tuple, Dict, Optional, Any
 from dataclasses import dataclass
@@ -50,6 +51,11 @@ PLAYER_DECELERATION = 0.15
 GHOST_SPEED = 1.5
 GHOST_CHASE_SPEED = 2.5
 GHOST_DETECTION_RADIUS = 100
+PARTICLE_FRICTION = 0.98  # velocity kept per frame
+MAX_PARTICLES = 512  # live effect particles kept at once; the oldest go first
+
+# Font sizes the UI asks for, loaded at startup
+UI_FONT_SIZES = (12, 14, 16, 18, 20, 24, 26, 36, 48, 50, 64)
 
 # Game Balance
 CANDIES_TO_COLLECT = 15
@@ -118,7 +124,13 @@ class PowerUp:
 
 class Particle:
     """Simple particle for visual effects"""
+    __slots__ = ('x', 'y', 'vx', 'vy', 'color', 'lifetime', 'max_lifetime')
+    
     def __init__(self, x: float, y: float, vx: float, vy: float, color: Tuple[int, int, int], lifetime: int):
+        self.reset(x, y, vx, vy, color, lifetime)
+    
+    def reset(self, x: float, y: float, vx: float, vy: float, color: Tuple[int, int, int], lifetime: int):
+        """Reinitialize the particle in place so it can be reused"""
         self.x = x
         self.y = y
         self.vx = vx
@@ -130,8 +142,8 @@ class Particle:
     def update(self):
         self.x += self.vx
         self.y += self.vy
-        self.vx *= 0.98  # slight friction
-        self.vy *= 0.98
+        self.vx *= PARTICLE_FRICTION  # slight friction
+        self.vy *= PARTICLE_FRICTION
         self.lifetime -= 1
         
     def draw(self, screen: pygame.Surface, camera_x: float, camera_y: float):
@@ -142,36 +154,125 @@ class Particle:
             pygame.draw.circle(screen, self.color, 
                              (int(self.x - camera_x), int(self.y - camera_y)), size)
 
+class ParticlePool:
+    """Recycles expired particles so bursts of effects don't allocate new objects"""
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.free: List[Particle] = [Particle(0, 0, 0, 0, WHITE, 0) for _ in range(capacity)]
+    
+    def acquire(self, x: float, y: float, vx: float, vy: float, color: Tuple[int, int, int], lifetime: int) -> Particle:
+        """Get a particle from the pool, or a new one if the pool is empty"""
+        if self.free:
+            particle = self.free.pop()
+            particle.reset(x, y, vx, vy, color, lifetime)
+            return particle
+        return Particle(x, y, vx, vy, color, lifetime)
+    
+    def release(self, particle: Particle):
+        """Return an expired particle to the pool"""
+        if len(self.free) < self.capacity:
+            self.free.append(particle)
+
+def step_particles(particles: List[Particle], pool: Optional[ParticlePool] = None):
+    """Advance a whole particle list one frame, dropping expired particles in place"""
+    # One pass: update live particles and compact them to the front, so no new
+    # list is built each frame. Particle.update() is inlined to save a call per particle,
+    # and each velocity is read once and reused for both the move and the friction.
+    friction = PARTICLE_FRICTION
+    write = 0
+    for particle in particles:
+        lifetime = particle.lifetime
+        if lifetime > 0:
+            vx = particle.vx
+            vy = particle.vy
+            particle.x += vx
+            particle.y += vy
+            particle.vx = vx * friction
+            particle.vy = vy * friction
+            particle.lifetime = lifetime - 1
+            particles[write] = particle
+            write += 1
+        elif pool is not None:
+            pool.release(particle)  # Recycle for the next burst
+    del particles[write:]
+
+@functools.lru_cache(maxsize=64)
+def _particle_sprite(color: Tuple[int, int, int], size: int) -> pygame.Surface:
+    """Pre-rendered particle circle, so a whole list can go through one Surface.blits call"""
+    surface = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (size, size), size)
+    return surface
+
+def draw_particles(screen: pygame.Surface, particles: List[Particle], camera_x: float, camera_y: float):
+    """Draw a particle list with a single blits() call (same output as Particle.draw on each)"""
+    sprite = _particle_sprite
+    # Particles are at most 3px in radius, so anything further off-screen is skipped
+    width, height = screen.get_size()
+    max_x = width + 3
+    max_y = height + 3
+    blits = []
+    for particle in particles:
+        lifetime = particle.lifetime
+        if lifetime > 0:
+            screen_x = int(particle.x - camera_x)
+            screen_y = int(particle.y - camera_y)
+            if -3 <= screen_x < max_x and -3 <= screen_y < max_y:
+                size = max(1, int(3 * (lifetime / particle.max_lifetime)))
+                blits.append((sprite(particle.color, size), (screen_x - size, screen_y - size)))
+    if blits:
+        screen.blits(blits, False)
+
+@functools.lru_cache(maxsize=64)
+def asset_exists(path: str) -> bool:
+    """Cached existence check for asset files that get probed repeatedly"""
+    return os.path.exists(path)
+
 class AssetManager:
     """Handles loading and fallback for game assets"""
     
     def __init__(self):
         self.images = {}
+        # Unscaled, converted image per path (None if missing/unreadable), so each file
+        # is stat'ed and decoded once however many sizes are requested
+        self.image_surfaces_by_path = {}
         self.sounds = {}
         self.fonts = {}
+        # Fallback system fonts by size, shared by every path that is missing
+        self.sysfont_cache: Dict[int, pygame.font.Font] = {}
         self.music_loaded = False
         
     def load_image(self, path: str, fallback_color: Tuple[int, int, int] = WHITE, 
                    size: Tuple[int, int] = (TILE_SIZE, TILE_SIZE)) -> pygame.Surface:
         """Load image with fallback to colored rectangle"""
-        if path in self.images:
-            return self.images[path]
-            
-        try:
-            if os.path.exists(path):
-                image = pygame.image.load(path).convert_alpha()
-                image = pygame.transform.scale(image, size)
-            else:
-                # Fallback: create colored rectangle
-                image = pygame.Surface(size, pygame.SRCALPHA)
-                image.fill(fallback_color)
-                
-        except pygame.error:
-            # Create fallback colored rectangle
+        # Keyed by size too, so callers asking for different sizes don't share one scale
+        key = (path, tuple(size))
+        image = self.images.get(key)
+        if image is not None:
+            return image
+        
+        if path in self.image_surfaces_by_path:
+            source = self.image_surfaces_by_path[path]
+        else:
+            try:
+                if os.path.exists(path):
+                    source = pygame.image.load(path).convert_alpha()
+                else:
+                    source = None
+            except pygame.error:
+                source = None
+            self.image_surfaces_by_path[path] = source
+        
+        if source is not None:
+            image = pygame.transform.scale(source, size)
+        else:
+            # Fallback: create colored rectangle
             image = pygame.Surface(size, pygame.SRCALPHA)
             image.fill(fallback_color)
+            if pygame.display.get_surface() is not None:
+                # Display format like loaded images, so blits need no per-pixel conversion
+                image = image.convert_alpha()
             
-        self.images[path] = image
+        self.images[key] = image
         return image
         
     def load_sound(self, path: str) -> Optional[pygame.mixer.Sound]:
@@ -193,7 +294,7 @@ class AssetManager:
     def load_music(self, path: str) -> bool:
         """Load background music"""
         try:
-            if os.path.exists(path):
+            if asset_exists(path):
                 pygame.mixer.music.load(path)
                 self.music_loaded = True
                 return True
@@ -203,20 +304,33 @@ class AssetManager:
         
     def load_font(self, path: str, size: int) -> pygame.font.Font:
         """Load font with fallback to system font"""
-        key = f"{path}_{size}"
-        if key in self.fonts:
-            return self.fonts[key]
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            return font
             
         try:
-            if os.path.exists(path):
+            if asset_exists(path):
                 font = pygame.font.Font(path, size)
             else:
-                font = pygame.font.SysFont('arial', size, bold=True)
+                font = self._load_sysfont(size)
         except pygame.error:
-            font = pygame.font.SysFont('arial', size, bold=True)
+            font = self._load_sysfont(size)
             
         self.fonts[key] = font
         return font
+    
+    def _load_sysfont(self, size: int) -> pygame.font.Font:
+        """Fallback font for a size; SysFont searches the system fonts, so it runs once per size"""
+        font = self.sysfont_cache.get(size)
+        if font is None:
+            font = self.sysfont_cache[size] = pygame.font.SysFont('arial', size, bold=True)
+        return font
+    
+    def prewarm_fonts(self, path: str, sizes: Tuple[int, ...]):
+        """Load a font in several sizes up front, so the first frames don't stall on font lookups"""
+        for size in sizes:
+            self.load_font(path, size)
 
 class Camera:
     """Simple camera system for smooth following"""
@@ -226,10 +340,10 @@ class Camera:
         self.y = 0.0
         self.target_x = 0.0
         self.target_y = 0.0
-        self.smoothing = 0.1
+        self.smoothing = 0.1  # fraction of the distance closed per frame at FPS
         
-    def update(self, target_x: float, target_y: float):
-        """Smooth camera movement toward target"""
+    def update(self, target_x: float, target_y: float, dt: Optional[float] = None):
+        """Smooth camera movement toward target; pass dt (seconds) to follow at the same speed at any frame rate"""
         self.target_x = target_x - SCREEN_WIDTH // 2
         self.target_y = target_y - SCREEN_HEIGHT // 2
         
@@ -240,9 +354,20 @@ class Camera:
         self.target_x = max(0, min(max_x, self.target_x))
         self.target_y = max(0, min(max_y, self.target_y))
         
-        # Smooth interpolation
-        self.x += (self.target_x - self.x) * self.smoothing
-        self.y += (self.target_y - self.y) * self.smoothing
+        # Smooth interpolation; exponential in dt, so it matches the fixed step at FPS
+        if dt is None:
+            alpha = self.smoothing
+        else:
+            alpha = 1.0 - (1.0 - self.smoothing) ** (dt * FPS)
+        self.x += (self.target_x - self.x) * alpha
+        self.y += (self.target_y - self.y) * alpha
+    
+    def is_visible(self, x: float, y: float, margin: float = 0) -> bool:
+        """Check if a world position is on screen, allowing margin pixels around the edges"""
+        screen_x = x - self.x
+        screen_y = y - self.y
+        return (-margin <= screen_x <= SCREEN_WIDTH + margin and
+                -margin <= screen_y <= SCREEN_HEIGHT + margin)
 
 class SaveManager:
     """Handles game save/load functionality"""
@@ -250,6 +375,9 @@ class SaveManager:
     def __init__(self):
         self.save_file = "save_data.txt"
         self.high_scores_file = "high_scores.txt"
+        # Parsed file contents, read once and kept current by the save methods
+        self._progress_cache: Optional[Dict[str, Any]] = None
+        self._scores_cache: Optional[List[Dict[str, Any]]] = None
         
     def save_progress(self, level: int, score: int, tutorial_completed: bool):
         """Save current game progress"""
@@ -258,53 +386,59 @@ class SaveManager:
             "score": score,
             "tutorial_completed": tutorial_completed
         }
+        self._progress_cache = data
         
         try:
+            # dumps() encodes in one C call and writes once; dump() streams chunks from Python
             with open(self.save_file, 'w') as f:
-                json.dump(data, f)
+                f.write(json.dumps(data))
         except IOError:
             pass  # Fail silently
             
     def load_progress(self) -> Dict[str, Any]:
         """Load saved game progress"""
-        default = {"level": 1, "score": 0, "tutorial_completed": False}
+        if self._progress_cache is not None:
+            return self._progress_cache
         
+        # Just try to open the file; a missing one is an IOError like any other
         try:
-            if os.path.exists(self.save_file):
-                with open(self.save_file, 'r') as f:
-                    return json.load(f)
+            with open(self.save_file, 'r') as f:
+                self._progress_cache = json.load(f)
         except (IOError, json.JSONDecodeError):
-            pass
+            self._progress_cache = {"level": 1, "score": 0, "tutorial_completed": False}
             
-        return default
+        return self._progress_cache
         
     def save_high_score(self, name: str, score: int):
         """Save high score"""
-        scores = self.load_high_scores()
-        scores.append({"name": name, "score": score})
+        scores = self.load_high_scores() + [{"name": name, "score": score}]  # Copy; the cache is shared
         scores.sort(key=lambda x: x["score"], reverse=True)
         scores = scores[:5]  # Keep top 5
+        self._scores_cache = scores
         
         try:
             with open(self.high_scores_file, 'w') as f:
-                json.dump(scores, f)
+                f.write(json.dumps(scores))
         except IOError:
             pass
             
     def load_high_scores(self) -> List[Dict[str, Any]]:
         """Load high scores"""
+        if self._scores_cache is not None:
+            return self._scores_cache
+        
         try:
-            if os.path.exists(self.high_scores_file):
-                with open(self.high_scores_file, 'r') as f:
-                    return json.load(f)
+            with open(self.high_scores_file, 'r') as f:
+                self._scores_cache = json.load(f)
         except (IOError, json.JSONDecodeError):
-            pass
+            self._scores_cache = []
             
-        return []
+        return self._scores_cache
 
 # Global instances
 asset_manager = AssetManager()
 camera = Camera()
+particle_pool = ParticlePool(256)
 save_manager = SaveManager()
 
 def main():
@@ -314,6 +448,13 @@ def main():
     pygame.display.set_caption("Halloween Haunt: Candy Quest - BETA")
     clock = pygame.time.Clock()
     
+    # Only queue the events the game handles; the mouse position and held keys are
+    # polled, so motion and other events are dropped by SDL before reaching Python.
+    # TEXTINPUT stays allowed: KEYDOWN.unicode (high score name entry) is filled from it
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+                              pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP])
+    
     # Load icon if available
     try:
         if os.path.exists("assets/icon.png"):
@@ -322,6 +463,9 @@ def main():
     except pygame.error:
         pass
     
+    # Resolve the UI fonts before the first frame needs them
+    asset_manager.prewarm_fonts("assets/fonts/creepy.ttf", UI_FONT_SIZES)
+    
     # Initialize game
     from game_manager import GameManager
     game_manager = GameManager(screen)
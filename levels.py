@@ -10,13 +10,14 @@ Level management and map generation for Halloween Haunt:         # Create starte
 
 import pygame
 import random
-import math
 from typing import List, Tuple, Dict, Optional
 from halloween_haunt import (
     MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, CANDIES_TO_COLLECT,
     TileType
 )
-from entities import TileMap, Candy, Ghost, EasterEgg
+from entities import TileMap, Candy, Ghost, EasterEgg, SpatialHash
+
+CEMETERY_EXIT_REACH_SQ = (TILE_SIZE * 1.5) ** 2  # Squared, so check_exit skips the sqrt
 
 class Level:
     """Manages individual game levels with maps, entities, and progression"""
@@ -27,6 +28,11 @@ class Level:
         self.candies: List[Candy] = []
         self.ghosts: List[Ghost] = []
         self.easter_eggs: List[EasterEgg] = []
+        self._ghost_rects: List[pygame.Rect] = []
+        
+        # Candies and eggs never move, so they are bucketed once for proximity queries
+        self.candy_grid = SpatialHash(TILE_SIZE * 2)
+        self.egg_grid = SpatialHash(TILE_SIZE * 2)
         
         # Level properties
         self.spawn_x = 0
@@ -270,7 +276,9 @@ class Level:
                     candy_type = "bonus"
                     points = 25
                 
-                self.candies.append(Candy(x, y, candy_type, points))
+                candy = Candy(x, y, candy_type, points)
+                self.candies.append(candy)
+                self.candy_grid.insert(candy, x, y)
                 candies_placed += 1
             
             attempts += 1
@@ -381,7 +389,9 @@ class Level:
                     if random.random() < 0.3:
                         egg_type = "secret"
                     
-                    self.easter_eggs.append(EasterEgg(x, y, egg_type, reward))
+                    egg = EasterEgg(x, y, egg_type, reward)
+                    self.easter_eggs.append(egg)
+                    self.egg_grid.insert(egg, x, y)
                     break
                 
                 attempts += 1
@@ -438,6 +448,14 @@ class Level:
         """Get the house position for level completion"""
         return self.house_x, self.house_y
     
+    def get_ghost_rects(self) -> List[pygame.Rect]:
+        """Collision rects of all ghosts, for one collidelistall() per frame"""
+        # Ghosts move their rects in place and are only ever appended,
+        # so the list only needs rebuilding when the count changes
+        if len(self._ghost_rects) != len(self.ghosts):
+            self._ghost_rects = [ghost.rect for ghost in self.ghosts]
+        return self._ghost_rects
+    
     def check_level_completion(self, player_x: float, player_y: float, candies_collected: int) -> bool:
         """Check if level completion conditions are met"""
         if candies_collected < CANDIES_TO_COLLECT:
@@ -533,6 +551,7 @@ class CemeteryArea:
         self.candies: List[Candy] = []
         self.ghosts: List[Ghost] = []
         self.easter_eggs: List[EasterEgg] = []
+        self._ghost_rects: List[pygame.Rect] = []
         
         # Cemetery-specific properties
         self.boss_ghost = None
@@ -684,10 +703,19 @@ class CemeteryArea:
                     break
                 attempts += 1
     
+    def get_ghost_rects(self) -> List[pygame.Rect]:
+        """Collision rects of all ghosts, for one collidelistall() per frame"""
+        # Ghosts move their rects in place and are only ever appended,
+        # so the list only needs rebuilding when the count changes
+        if len(self._ghost_rects) != len(self.ghosts):
+            self._ghost_rects = [ghost.rect for ghost in self.ghosts]
+        return self._ghost_rects
+    
     def check_exit(self, player_x: float, player_y: float) -> bool:
         """Check if player is exiting the cemetery"""
-        distance = math.sqrt((player_x - self.entrance_x) ** 2 + (player_y - self.entrance_y) ** 2)
-        return distance < TILE_SIZE * 1.5
+        dx = player_x - self.entrance_x
+        dy = player_y - self.entrance_y
+        return dx * dx + dy * dy < CEMETERY_EXIT_REACH_SQ
     
     def update(self, player):
         """Update cemetery entities"""
@@ -10,10 +10,19 @@ from typing import List, Tuple, Optional, Dict
 from halloween_haunt import (
     SCREEN_WIDTH, SCREEN_HEIGHT, TILE_SIZE,
     WHITE, BLACK, ORANGE, GRAY, RED, GREEN, BLUE, BROWN, YELLOW, PURPLE,
-    asset_manager, camera
+    asset_manager, camera, particle_pool, step_particles, draw_particles
 )
 from entities import Player, Particle
 
+# Interaction radii, squared so the distance checks can skip the sqrt
+SPECIAL_CANDY_REACH_SQ = 20 * 20  # Pickup radius
+ALTAR_REACH_SQ = 50 * 50
+DIG_REACH_SQ = 30 * 30
+TRAP_TRIGGER_RADIUS = 40
+TRAP_DAMAGE_RADIUS = 60
+TRAP_TRIGGER_RADIUS_SQ = TRAP_TRIGGER_RADIUS * TRAP_TRIGGER_RADIUS
+TRAP_DAMAGE_RADIUS_SQ = TRAP_DAMAGE_RADIUS * TRAP_DAMAGE_RADIUS
+
 class ChurchPuzzle:
     """Church interior puzzle - rearrange symbols for bonus candy"""
     
@@ -41,9 +50,10 @@ class ChurchPuzzle:
     
     def interact(self, player: Player) -> Tuple[bool, str, List[Particle]]:
         """Interact with the church puzzle"""
-        distance = math.sqrt((player.x - self.x) ** 2 + (player.y - self.y) ** 2)
+        dx = player.x - self.x
+        dy = player.y - self.y
         
-        if distance > 50:
+        if dx * dx + dy * dy > ALTAR_REACH_SQ:
             return False, "Get closer to the altar!", []
         
         if self.completed:
@@ -90,7 +100,7 @@ class ChurchPuzzle:
                     vx = math.cos(angle) * speed
                     vy = math.sin(angle) * speed
                     color = random.choice([YELLOW, WHITE, BLUE])
-                    particles.append(Particle(self.x, self.y, vx, vy, color, 90))
+                    particles.append(particle_pool.acquire(self.x, self.y, vx, vy, color, 90))
                 
                 return True, particles
             else:
@@ -162,9 +172,10 @@ class CemeteryDigging:
         
     def interact(self, player: Player) -> Tuple[bool, str, List[Particle]]:
         """Start digging interaction"""
-        distance = math.sqrt((player.x - self.x) ** 2 + (player.y - self.y) ** 2)
+        dx = player.x - self.x
+        dy = player.y - self.y
         
-        if distance > 30:
+        if dx * dx + dy * dy > DIG_REACH_SQ:
             return False, "Find a good spot to dig!", []
         
         if self.completed:
@@ -191,7 +202,7 @@ class CemeteryDigging:
             speed = random.uniform(3, 6)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed - 2  # Upward bias
-            particles.append(Particle(self.x, self.y - 10, vx, vy, BROWN, 45))
+            particles.append(particle_pool.acquire(self.x, self.y - 10, vx, vy, BROWN, 45))
         
         # Check if digging is complete
         if self.dig_progress >= self.required_digs:
@@ -205,7 +216,7 @@ class CemeteryDigging:
                 vx = math.cos(angle) * speed
                 vy = math.sin(angle) * speed
                 color = random.choice([YELLOW, ORANGE, GREEN])
-                particles.append(Particle(self.x, self.y, vx, vy, color, 60))
+                particles.append(particle_pool.acquire(self.x, self.y, vx, vy, color, 60))
             
             return True, particles
         
@@ -217,9 +228,7 @@ class CemeteryDigging:
             self.dig_timer -= 1
         
         # Update dirt particles
-        self.dirt_particles = [p for p in self.dirt_particles if p.lifetime > 0]
-        for particle in self.dirt_particles:
-            particle.update()
+        step_particles(self.dirt_particles)
     
     def draw(self, screen: pygame.Surface):
         """Draw digging site"""
@@ -247,8 +256,7 @@ class CemeteryDigging:
             pygame.draw.circle(screen, ORANGE, (screen_x, screen_y), 5)
         
         # Draw dirt particles
-        for particle in self.dirt_particles:
-            particle.draw(screen, camera.x, camera.y)
+        draw_particles(screen, self.dirt_particles, camera.x, camera.y)
 
 class JackOLanternTrap:
     """Explosive jack-o'-lantern trap for higher levels"""
@@ -259,8 +267,8 @@ class JackOLanternTrap:
         self.triggered = False
         self.explosion_timer = 0
         self.explosion_duration = 30
-        self.trigger_radius = 40
-        self.damage_radius = 60
+        self.trigger_radius = TRAP_TRIGGER_RADIUS
+        self.damage_radius = TRAP_DAMAGE_RADIUS
         
         # Visual properties
         self.glow_timer = 0
@@ -275,9 +283,10 @@ class JackOLanternTrap:
             
             if self.explosion_timer >= self.explosion_duration:
                 # Check if player is in damage radius
-                distance = math.sqrt((player.x - self.x) ** 2 + (player.y - self.y) ** 2)
+                dx = player.x - self.x
+                dy = player.y - self.y
                 
-                if distance <= self.damage_radius:
+                if dx * dx + dy * dy <= TRAP_DAMAGE_RADIUS_SQ:
                     # Damage player
                     if player.take_damage():
                         pass  # Player was damaged
@@ -290,14 +299,15 @@ class JackOLanternTrap:
                     vx = math.cos(angle) * speed
                     vy = math.sin(angle) * speed
                     color = random.choice([RED, ORANGE, YELLOW])
-                    particles.append(Particle(self.x, self.y, vx, vy, color, 40))
+                    particles.append(particle_pool.acquire(self.x, self.y, vx, vy, color, 40))
                 
                 return True, particles
         else:
             # Check if player is within trigger radius
-            distance = math.sqrt((player.x - self.x) ** 2 + (player.y - self.y) ** 2)
+            dx = player.x - self.x
+            dy = player.y - self.y
             
-            if distance <= self.trigger_radius:
+            if dx * dx + dy * dy <= TRAP_TRIGGER_RADIUS_SQ:
                 self.triggered = True
         
         return False, []
@@ -359,7 +369,7 @@ class PowerUpGenerator:
             speed = random.uniform(2, 5)
             vx = math.cos(angle) * speed
             vy = math.sin(angle) * speed
-            particles.append(Particle(player.x, player.y, vx, vy, GREEN, 90))
+            particles.append(particle_pool.acquire(player.x, player.y, vx, vy, GREEN, 90))
         
         return particles
     
@@ -423,9 +433,10 @@ class SpecialCandy:
         """Check if candy has expired"""
         return self.lifetime <= 0
     
-    def collect(self, player: Player) -> List[Particle]:
-        """Collect this special candy"""
-        particles = []
+    def collect(self, player: Player, particles: Optional[List[Particle]] = None) -> List[Particle]:
+        """Collect this special candy, appending its particles to particles if given"""
+        if particles is None:
+            particles = []
         
         if not self.collected and self.lifetime > 0:
             self.collected = True
@@ -438,7 +449,7 @@ class SpecialCandy:
                 vx = math.cos(angle) * speed
                 vy = math.sin(angle) * speed
                 color = random.choice([YELLOW, WHITE, BLUE])
-                particles.append(Particle(self.x, self.y, vx, vy, color, 45))
+                particles.append(particle_pool.acquire(self.x, self.y, vx, vy, color, 45))
         
         return particles
     
@@ -539,12 +550,15 @@ class SpecialFeaturesManager:
             if exploded:
                 self.traps.remove(trap)
         
-        # Update special candies
-        for candy in self.special_candies[:]:
+        # Update special candies, compacting out expired ones in place
+        candies = self.special_candies
+        write = 0
+        for candy in candies:
             candy.update()
-            
-            if candy.is_expired():
-                self.special_candies.remove(candy)
+            if not candy.is_expired():
+                candies[write] = candy
+                write += 1
+        del candies[write:]
         
         return particles, message
     
@@ -574,12 +588,14 @@ class SpecialFeaturesManager:
                     break
         
         # Check special candy collection
+        px = player.x
+        py = player.y
         for candy in self.special_candies:
             if not candy.collected:
-                distance = math.sqrt((player.x - candy.x) ** 2 + (player.y - candy.y) ** 2)
-                if distance <= 20:
-                    candy_particles = candy.collect(player)
-                    particles.extend(candy_particles)
+                dx = px - candy.x
+                dy = py - candy.y
+                if dx * dx + dy * dy <= SPECIAL_CANDY_REACH_SQ:
+                    candy.collect(player, particles)
         
         return particles, message
     
@@ -10,9 +10,22 @@ from typing import List, Tuple, Optional, Callable
 from halloween_haunt import (
     SCREEN_WIDTH, SCREEN_HEIGHT, CANDIES_TO_COLLECT,
     WHITE, BLACK, ORANGE, RED, GREEN, BLUE, GRAY, DARK_GRAY, YELLOW,
-    TRANSPARENT_GRAY, GameState, asset_manager
+    TRANSPARENT_GRAY, GameState, PowerUpType, asset_manager
 )
 
+# HUD display names, keyed by the enum member itself
+POWERUP_NAMES = {
+    PowerUpType.CANDY_MAGNET: "Candy Magnet",
+    PowerUpType.GHOST_REPEL: "Ghost Repel",
+    PowerUpType.SPEED_BOOST: "Speed Boost",
+    PowerUpType.EXTRA_HEART: "Extra Heart",
+    PowerUpType.ZOMBIE_POWER: "Zombie Power",
+    PowerUpType.INVISIBILITY: "Invisibility",
+    PowerUpType.TIME_SLOW: "Time Slow",
+    PowerUpType.DOUBLE_POINTS: "Double Points",
+    PowerUpType.SHIELD: "Shield"
+}
+
 class Button:
     """Interactive button for menus"""
     
@@ -127,7 +140,8 @@ class MainMenu(Menu):
     def _create_spooky_background(self):
         """Create enhanced Halloween-themed background with animations"""
         # Animated gradient background
-        time_factor = pygame.time.get_ticks() * 0.001
+        ticks = pygame.time.get_ticks()
+        time_factor = ticks * 0.001
         
         for y in range(SCREEN_HEIGHT):
             # Create pulsing, swirling colors
@@ -154,7 +168,7 @@ class MainMenu(Menu):
         
         # Add animated bats flying across the screen
         for i in range(3):
-            bat_x = ((pygame.time.get_ticks() * 0.1 + i * 200) % (SCREEN_WIDTH + 100)) - 50
+            bat_x = ((ticks * 0.1 + i * 200) % (SCREEN_WIDTH + 100)) - 50
             bat_y = 100 + i * 80 + int(20 * math.sin(time_factor * 2 + i))
             
             # Simple bat shape
@@ -279,9 +293,10 @@ class MainMenu(Menu):
             self.last_char_time = 0
 
         if self.subtitle_chars < len(subtitle_text):
-            if pygame.time.get_ticks() - self.last_char_time > 50:  # 50ms per character
+            now = pygame.time.get_ticks()
+            if now - self.last_char_time > 50:  # 50ms per character
                 self.subtitle_chars += 1
-                self.last_char_time = pygame.time.get_ticks()
+                self.last_char_time = now
 
         animated_subtitle = subtitle_text[:self.subtitle_chars]
         animated_surface = subtitle_font.render(animated_subtitle, True, WHITE)
@@ -577,31 +592,20 @@ class HUD:
     
     def _draw_powerups(self, screen: pygame.Surface, player):
         """Draw active power-up indicators"""
-        if not player.active_powerups:
+        active_powerups = player.active_powerups  # Built from the timers, so fetch once
+        if not active_powerups:
             return
         
         powerup_x = SCREEN_WIDTH - 200
         powerup_y = 70
         
-        for i, powerup in enumerate(player.active_powerups):
+        for i, powerup in enumerate(active_powerups):
             # Background
             bg_rect = pygame.Rect(powerup_x, powerup_y + i * 30, 180, 25)
             pygame.draw.rect(screen, (0, 0, 0, 128), bg_rect)
             
             # Power-up name
-            powerup_names = {
-                "CANDY_MAGNET": "Candy Magnet",
-                "GHOST_REPEL": "Ghost Repel",
-                "SPEED_BOOST": "Speed Boost",
-                "EXTRA_HEART": "Extra Heart",
-                "ZOMBIE_POWER": "Zombie Power",
-                "INVISIBILITY": "Invisibility",
-                "TIME_SLOW": "Time Slow",
-                "DOUBLE_POINTS": "Double Points",
-                "SHIELD": "Shield"
-            }
-            
-            name = powerup_names.get(powerup.type.name, "Unknown")
+            name = POWERUP_NAMES.get(powerup.type, "Unknown")
             time_left = powerup.duration // 60  # Convert to seconds
             
             text = f"{name} ({time_left}s)"